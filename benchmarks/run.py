@@ -0,0 +1,266 @@
+"""Offline benchmarks for the Xweatherly integration.
+
+Runs the real coordinator and entity platforms against the local Xweather
+stand-in (stand_in.py) and reports:
+
+  * refresh     end-to-end time of XweatherlyDataCoordinator._async_update_data
+  * render      time to compute the state of every entity the platforms create
+  * forecast    async_forecast_hourly / async_forecast_daily calls per second,
+                cold (cache cleared) and warm
+  * memory      bytes held by one coordinator after its first refresh
+  * profile     the xweatherly.profile action replaying ./fixtures, per cycle
+
+Requires Home Assistant to be installed (`pip install homeassistant`). Example:
+
+    python benchmarks/run.py --iterations 50 --latency 120 --error-rate 0.05
+    python benchmarks/run.py --batch --json results.json
+    python benchmarks/run.py --forecast-hours 240 --only refresh forecast
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import aiohttp  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM  # noqa: E402
+
+from custom_components.xweatherly import api, weather  # noqa: E402
+from custom_components.xweatherly.const import (  # noqa: E402
+    CONF_BATCH_REQUESTS,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_FORECAST_HOURS,
+    CONF_OBSERVATION_SOURCE,
+    DOMAIN,
+    OBSERVATION_SOURCE_MODEL,
+    OBSERVATION_SOURCE_STATION,
+)
+from custom_components.xweatherly.coordinator import XweatherlyDataCoordinator  # noqa: E402
+from custom_components.xweatherly.profiler import async_profile  # noqa: E402
+from custom_components.xweatherly.replay import ScratchEntry, async_create_entities  # noqa: E402
+from stand_in import FIXTURES, XweatherStandIn  # noqa: E402
+
+BENCHMARKS = ("refresh", "render", "forecast", "memory", "profile")
+
+def _summary(samples: list[float]) -> dict:
+    """Return timing statistics in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[max(0, round(len(ordered) * 0.95) - 1)] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+
+
+class Bench:
+    """Benchmark harness holding the Home Assistant instance and stand-in."""
+
+    def __init__(self, hass: HomeAssistant, stand_in: XweatherStandIn, args) -> None:
+        self.hass = hass
+        self.stand_in = stand_in
+        self.args = args
+        self._entries = []
+
+    def entry(self, name: str) -> ScratchEntry:
+        """Create an entry with its own credentials, so it gets its own client."""
+        entry = ScratchEntry(
+            f"bench_{name}",
+            {
+                CONF_CLIENT_ID: f"bench-{name}",
+                CONF_CLIENT_SECRET: "secret",
+                "name": f"Bench {name}",
+                "latitude": 35.77,
+                "longitude": -78.64,
+                CONF_BATCH_REQUESTS: self.args.batch,
+                CONF_FORECAST_HOURS: self.args.forecast_hours,
+                CONF_OBSERVATION_SOURCE: (
+                    OBSERVATION_SOURCE_STATION if self.args.stations else OBSERVATION_SOURCE_MODEL
+                ),
+            },
+        )
+        self._entries.append(entry)
+        return entry
+
+    def coordinator(self, entry: ScratchEntry) -> XweatherlyDataCoordinator:
+        """Create a coordinator pointed at the stand-in."""
+        coordinator = XweatherlyDataCoordinator(self.hass, entry)
+        coordinator.client.api_base = self.stand_in.url
+        self.hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        return coordinator
+
+    async def refreshed_coordinator(self, name: str) -> XweatherlyDataCoordinator:
+        """Create a coordinator and complete a full refresh.
+
+        Error injection is paused for this setup refresh, so the benchmarks
+        that measure rendering always start from complete data.
+        """
+        coordinator = self.coordinator(self.entry(name))
+        coordinator._force_refresh = True
+        errors, self.stand_in.errors = self.stand_in.errors, {}
+        try:
+            data = await coordinator._async_update_data()
+        finally:
+            self.stand_in.errors = errors
+        coordinator.async_set_updated_data(data)
+        return coordinator
+
+    async def entities(self, coordinator) -> list:
+        """Create every entity the platforms set up for the coordinator's entry."""
+        return await async_create_entities(self.hass, coordinator.entry)
+
+    def close(self) -> None:
+        for entry in self._entries:
+            entry.unload()
+
+    async def bench_refresh(self) -> dict:
+        coordinator = self.coordinator(self.entry("refresh"))
+        samples = []
+        failures = 0
+        for _ in range(self.args.iterations):
+            coordinator._force_refresh = True
+            start = time.perf_counter()
+            try:
+                data = await coordinator._async_update_data()
+            except Exception:  # injected errors are expected
+                failures += 1
+                continue
+            samples.append(time.perf_counter() - start)
+            coordinator.async_set_updated_data(data)
+        result = _summary(samples) if samples else {"n": 0}
+        result["failed_refreshes"] = failures
+        result["stand_in_requests"] = dict(self.stand_in.requests)
+        return result
+
+    async def bench_render(self) -> dict:
+        coordinator = await self.refreshed_coordinator("render")
+        entities = await self.entities(coordinator)
+        samples = []
+        for _ in range(self.args.iterations):
+            start = time.perf_counter()
+            for entity in entities:
+                entity._state_fingerprint()
+            samples.append(time.perf_counter() - start)
+        result = _summary(samples)
+        result["entities"] = len(entities)
+        return result
+
+    async def bench_forecast(self) -> dict:
+        coordinator = await self.refreshed_coordinator("forecast")
+        entity = weather.XweatherlyWeather(coordinator, coordinator.entry)
+        entity.hass = self.hass
+        result = {}
+        for forecast_type in ("hourly", "daily"):
+            method = getattr(entity, f"async_forecast_{forecast_type}")
+            for mode in ("cold", "warm"):
+                calls = self.args.iterations * 10
+                start = time.perf_counter()
+                for _ in range(calls):
+                    if mode == "cold":
+                        entity._forecast_cache.clear()
+                    forecast = await method()
+                elapsed = time.perf_counter() - start
+                result[f"{forecast_type}_{mode}_per_s"] = calls / elapsed
+            result[f"{forecast_type}_periods"] = len(forecast)
+        return result
+
+    async def bench_memory(self) -> dict:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        coordinator = await self.refreshed_coordinator("memory")
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        del coordinator
+        return {"bytes_per_coordinator": held}
+
+    async def bench_profile(self) -> dict:
+        coordinator = self.coordinator(self.entry("profile"))
+        self.hass.config.allowlist_external_dirs.add(str(FIXTURES))
+        result = await async_profile(
+            self.hass, coordinator.entry, cycles=self.args.iterations, fixture=str(FIXTURES), top=1
+        )
+        return {
+            "cycles": result["cycles"],
+            "ms_per_cycle": result["elapsed_seconds"] * 1000 / result["cycles"],
+            "refresh_succeeded": result["refresh_succeeded"],
+            "top_cumulative": result["hot_spots"][0]["function"],
+        }
+
+
+def _print(results: dict) -> None:
+    for name, values in results.items():
+        print(f"\n{name}")
+        for key, value in values.items():
+            if isinstance(value, float):
+                value = f"{value:,.3f}"
+            print(f"  {key:<28} {value}")
+
+
+async def _run(args) -> dict:
+    stand_in = XweatherStandIn(
+        latency=args.latency / 1000, errors={"*": args.error_rate}, seed=args.seed
+    )
+    await stand_in.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        if hasattr(frame, "async_setup"):
+            frame.async_setup(hass)
+        hass.config.units = US_CUSTOMARY_SYSTEM if args.imperial else METRIC_SYSTEM
+        # Newer Home Assistant resolves the shared session through zeroconf,
+        # which a bare instance has not set up; the stand-in is on localhost
+        session = aiohttp.ClientSession()
+        api.async_get_clientsession = lambda _hass: session
+        bench = Bench(hass, stand_in, args)
+        results = {}
+        try:
+            for name in args.only or BENCHMARKS:
+                results[name] = await getattr(bench, f"bench_{name}")()
+        finally:
+            bench.close()
+            await stand_in.stop()
+            await session.close()
+            await hass.async_stop(force=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Xweatherly offline benchmarks")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0, help="stand-in milliseconds per request")
+    parser.add_argument("--error-rate", type=float, default=0, help="stand-in 0..1 per request")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--batch", action="store_true", help="use batch request mode")
+    parser.add_argument("--forecast-hours", type=int, default=24, help="hourly forecast horizon")
+    parser.add_argument("--stations", action="store_true", help="use station observations")
+    parser.add_argument("--imperial", action="store_true", help="use US customary units")
+    parser.add_argument(
+        "--only", nargs="+", choices=BENCHMARKS
+    )
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    _print(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
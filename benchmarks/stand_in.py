@@ -0,0 +1,133 @@
+"""Local stand-in for data.api.xweather.com serving recorded payloads.
+
+Serves the fixtures in ./fixtures for the endpoints the integration uses,
+including /batch, with configurable latency and error injection. Run it on
+its own to poke at it with curl:
+
+    python benchmarks/stand_in.py --port 8765 --latency 150 --error-rate 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.xweatherly.replay import FixtureReplay, load_fixtures  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class XweatherStandIn:
+    """aiohttp application mimicking the Xweather endpoints we call.
+
+    `latency` is in seconds per request, `errors` maps an endpoint (or "*")
+    to the probability of answering it with an HTTP 500.
+    """
+
+    def __init__(self, fixtures=None, latency: float = 0.0, errors=None, seed=None):
+        self.replay = FixtureReplay(fixtures or load_fixtures(FIXTURES))
+        self.latency = latency
+        self.errors = errors or {}
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self.app = web.Application()
+        self.app.router.add_get("/batch/{location}", self._batch)
+        # Station requests name their location with `p`
+        self.app.router.add_get("/observations/closest", self._single)
+        self.app.router.add_get("/observations", self._single)
+        self.app.router.add_get("/{endpoint}/{location}", self._single)
+        self._runner = None
+        self.url = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _fails(self, endpoint: str) -> bool:
+        rate = self.errors.get(endpoint, self.errors.get("*", 0.0))
+        return self._random.random() < rate
+
+    def _response(self, endpoint: str, params: dict) -> dict:
+        """Return the recorded response for a request, trimmed to its query."""
+        return self.replay.response(endpoint, params)
+
+    async def _single(self, request: web.Request) -> web.Response:
+        endpoint = request.match_info.get("endpoint") or request.path.strip("/")
+        self.requests[endpoint] += 1
+        await asyncio.sleep(self.latency)
+        if self._fails(endpoint):
+            return web.Response(status=500, text="injected error")
+        return web.json_response(self._response(endpoint, dict(request.query)))
+
+    async def _batch(self, request: web.Request) -> web.Response:
+        self.requests["batch"] += 1
+        await asyncio.sleep(self.latency)
+        if self._fails("batch"):
+            return web.Response(status=500, text="injected error")
+        responses = []
+        for item in request.query.get("requests", "").split(","):
+            parts = urlsplit(item)
+            endpoint = parts.path.strip("/")
+            self.requests[endpoint] += 1
+            if self._fails(endpoint):
+                responses.append(
+                    {
+                        "success": False,
+                        "error": {"code": "internal_error", "description": "injected error"},
+                        "request": item,
+                        "response": [],
+                    }
+                )
+                continue
+            response = self._response(endpoint, dict(parse_qsl(parts.query)))
+            responses.append({**response, "request": item})
+        return web.json_response(
+            {"success": True, "error": None, "response": {"responses": responses}}
+        )
+
+
+async def _serve(args) -> None:
+    stand_in = XweatherStandIn(
+        latency=args.latency / 1000, errors={"*": args.error_rate}, seed=args.seed
+    )
+    url = await stand_in.start(args.host, args.port)
+    print(f"Serving Xweather stand-in at {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stand_in.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds per request")
+    parser.add_argument("--error-rate", type=float, default=0, help="0..1 per request")
+    parser.add_argument("--seed", type=int, default=None)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
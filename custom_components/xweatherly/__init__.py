@@ -2,33 +2,124 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN, PLATFORMS
-from .coordinator import XweatherlyDataCoordinator
+from .budget import async_remove_budget
+from .coordinator import XweatherlyDataCoordinator, async_remove_stored_data
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_FIXTURE = "fixture"
+ATTR_OUTPUT = "output"
+ATTR_SORT = "sort"
+ATTR_TOP = "top"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+        vol.Optional(ATTR_FIXTURE): cv.string,
+        vol.Optional(ATTR_OUTPUT): cv.string,
+        vol.Optional(ATTR_SORT, default="cumulative"): vol.In(
+            ("cumulative", "tottime", "calls")
+        ),
+        vol.Optional(ATTR_TOP, default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config) -> bool:
+    """Register the Xweatherly services."""
+
+    async def _async_profile(call: ServiceCall):
+        """Profile refresh and render cycles of a loaded entry."""
+        # Imported here so the profiler's platform imports stay off setup
+        from .profiler import async_profile
+
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+            entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if len(entries) != 1:
+            raise HomeAssistantError(
+                "Specify the config_entry_id of a loaded Xweatherly entry to profile"
+            )
+        return await async_profile(
+            hass,
+            entries[0],
+            cycles=call.data[ATTR_CYCLES],
+            fixture=call.data.get(ATTR_FIXTURE),
+            output=call.data.get(ATTR_OUTPUT),
+            sort=call.data[ATTR_SORT],
+            top=call.data[ATTR_TOP],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Xweatherly from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
     coordinator = XweatherlyDataCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.budget.async_load()
+    # Serve the persisted payload right away when there is one
+    warm_start = await coordinator.async_restore()
+    if not warm_start:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Forward the setup of platforms and await their completion.
+    # Forward the setup of platforms and await their completion. Entities
+    # render the restored or first-refreshed data; they do not refresh on add.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # The entities have registered the fields they read; request only those
+    coordinator.async_start_field_projection()
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    if warm_start:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} warm start refresh"
+        )
+
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator, without a reload."""
+    await hass.data[DOMAIN][entry.entry_id].async_apply_options()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a Xweatherly config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted payload of a deleted Xweatherly config entry."""
+    await async_remove_stored_data(hass, entry.entry_id)
+    await async_remove_budget(hass, entry.entry_id)
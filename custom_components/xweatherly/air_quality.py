@@ -7,8 +7,8 @@ from homeassistant.const import (
     CONCENTRATION_PARTS_PER_MILLION,
 )
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, DEFAULT_NAME
+from .const import DOMAIN, DEFAULT_NAME, TIER_EXTENDED, normalize_pollutant_key
+from .entity import XweatherlyEntity
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Xweatherly Air Quality entities."""
@@ -17,15 +17,17 @@ async def async_setup_entry(hass, entry, async_add_entities):
         [
             XweatherlyAirQuality(coordinator, entry),
             XweatherlyDominantPollutantSensor(coordinator, entry),
-        ],
-        True,
+        ]
     )
 
 
-class XweatherlyAirQuality(CoordinatorEntity, AirQualityEntity):
+class XweatherlyAirQuality(XweatherlyEntity, AirQualityEntity):
     """Xweatherly Air Quality Entity."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _sources = ("airquality",)
+    _fields = {"airquality": ("aqi", "category", "health", "pollutants")}
+    _tier = TIER_EXTENDED
 
     def __init__(self, coordinator, entry):
         """Initialize the Xweatherly Air Quality entity."""
@@ -80,6 +82,7 @@ class XweatherlyAirQuality(CoordinatorEntity, AirQualityEntity):
             return {}
         period = periods[0]
         return {
+            **(super().extra_state_attributes or {}),
             "aqi_category": period.get("category"),
             "health_index": period.get("health", {}).get("index"),
             "health_category": period.get("health", {}).get("category"),
@@ -146,42 +149,17 @@ class XweatherlyAirQuality(CoordinatorEntity, AirQualityEntity):
         return CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
 
     def _get_pollutant(self, key: str):
-        """
-        Helper to get a specific pollutant's value.
-        This method is refactored to be more robust and efficient.
-        It first creates a dictionary of pollutants for quick lookup,
-        and then returns the concentration for the requested key.
-        """
-        aq = self.coordinator.data.get("airquality", {})
-        periods = aq.get("periods", [{}])
-        if not periods:
-            return None
-
-        # Build a dictionary of pollutants for O(1) lookup
-        pollutants_dict = {
-            (pol.get("type") or pol.get("name", "").lower()).replace(".", "").replace(" ", "").lower(): pol
-            for pol in periods[0].get("pollutants", [])
-        }
-
-        # Normalize the key we are looking for
-        match_key = key.replace(".", "").lower()
-
-        pollutant_data = pollutants_dict.get(match_key)
-        if not pollutant_data:
-            return None
-
-        # Return the most relevant concentration value
-        return (
-            pollutant_data.get("valueUGM3")
-            or pollutant_data.get("concentrationUGM3")
-            or pollutant_data.get("value")
-        )
+        """Return a pollutant's concentration from the coordinator's index."""
+        return self.coordinator.pollutants.get(normalize_pollutant_key(key))
 
-class XweatherlyDominantPollutantSensor(CoordinatorEntity, SensorEntity):
+class XweatherlyDominantPollutantSensor(XweatherlyEntity, SensorEntity):
     """Xweatherly Dominant Pollutant Sensor Entity."""
 
     _attr_device_class = None
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _sources = ("airquality",)
+    _fields = {"airquality": ("dominant",)}
+    _tier = TIER_EXTENDED
 
     def __init__(self, coordinator, entry):
         """Initialize the Xweatherly Dominant Pollutant sensor."""
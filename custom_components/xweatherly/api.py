@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import timedelta
+from urllib.parse import quote
+
+import aiohttp
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import (
+    API_BASE,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    DATA_CLIENTS,
+    FETCH_TIMEOUT,
+    JSON_EXECUTOR_THRESHOLD,
+    LATENCY_BUCKETS,
+    LOCATION_PRECISION,
+    entry_config,
+)
+
+
+def _request_key(endpoint: str, extra_params=None):
+    """Return a hashable key identifying an endpoint request."""
+    return (endpoint, tuple(sorted((extra_params or {}).items())))
+
+
+def _stats_label(endpoint: str, extra_params=None) -> str:
+    """Return the name statistics are recorded under for a request."""
+    if extra_params and "filter" in extra_params:
+        return f"{endpoint}:{extra_params['filter']}"
+    return endpoint
+
+
+def _cache_slot(key) -> str:
+    """Return the cache slot of a request key: its endpoint and filter."""
+    endpoint, params = key
+    return _stats_label(endpoint, dict(params))
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Latency, response size, decode cost and errors recorded for one endpoint."""
+
+    responses: int = 0
+    bytes_received: int = 0
+    last_bytes: int = 0
+    decode_seconds: float = 0.0
+    last_decode_seconds: float = 0.0
+    executor_decodes: int = 0
+    # Request counts per LATENCY_BUCKETS bucket, plus one overflow bucket
+    latency_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_seconds: float = 0.0
+    last_latency_seconds: float = 0.0
+    errors: int = 0
+    last_error: str | None = None
+    last_error_at: str | None = None
+
+    def record(self, size: int, decode_seconds: float, in_executor: bool) -> None:
+        """Record one decoded response."""
+        self.responses += 1
+        self.bytes_received += size
+        self.last_bytes = size
+        self.decode_seconds += decode_seconds
+        self.last_decode_seconds = decode_seconds
+        self.executor_decodes += in_executor
+
+    def record_latency(self, seconds: float) -> None:
+        """Record the time from sending a request to reading its body."""
+        self.latency_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.latency_seconds += seconds
+        self.last_latency_seconds = seconds
+
+    def record_error(self, err: Exception) -> None:
+        """Record a failed request."""
+        self.errors += 1
+        self.last_error = str(err)
+        self.last_error_at = dt_util.utcnow().isoformat()
+
+    def as_dict(self) -> dict:
+        """Return the statistics with the histogram keyed by bucket."""
+        bounds = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "responses": self.responses,
+            "bytes_received": self.bytes_received,
+            "last_bytes": self.last_bytes,
+            "decode_seconds": round(self.decode_seconds, 4),
+            "last_decode_seconds": round(self.last_decode_seconds, 4),
+            "executor_decodes": self.executor_decodes,
+            "latency_histogram": dict(zip(bounds, self.latency_counts)),
+            "latency_seconds": round(self.latency_seconds, 3),
+            "last_latency_seconds": round(self.last_latency_seconds, 3),
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at,
+        }
+
+
+class XweatherlyNoData(UpdateFailed):
+    """Xweather answered, but with an error or without any result."""
+
+
+def _first(response):
+    """Return the first result of a response; single-item ones are objects."""
+    if isinstance(response, dict):
+        return response
+    return response[0]
+
+
+def _payload(endpoint: str, data):
+    """Return the first result of a response body, raising when it has none.
+
+    Xweather answers `warn_no_data` (common for air quality) and errors with
+    an empty `response`, which must not replace the last good payload.
+    """
+    response = data.get("response")
+    if not data.get("success", True) or not response:
+        error = data.get("error") or {}
+        raise XweatherlyNoData(
+            f"{endpoint} failed: {error.get('description', 'no data returned')}"
+        )
+    return _first(response)
+
+
+def _batch_request(endpoint: str, extra_params=None) -> str:
+    """Render an endpoint request as an entry of the batch `requests` list."""
+    if not extra_params:
+        return f"/{endpoint}"
+    # Quote values so commas inside them are not read as request separators
+    query = "&".join(
+        f"{name}={quote(str(value), safe='')}" for name, value in extra_params.items()
+    )
+    return f"/{endpoint}?{query}"
+
+
+@callback
+def async_get_client(hass: HomeAssistant, entry) -> XweatherlyApiClient:
+    """Return the shared API client for an entry's account and location.
+
+    Entries using the same credentials at the same rounded location share one
+    client, so their identical requests are fetched (and billed) once.
+    """
+    clients = hass.data.setdefault(DATA_CLIENTS, {})
+    config = entry_config(entry)
+    lat = config.get(CONF_LATITUDE, hass.config.latitude)
+    lon = config.get(CONF_LONGITUDE, hass.config.longitude)
+    key = (
+        entry.data[CONF_CLIENT_ID],
+        round(lat, LOCATION_PRECISION),
+        round(lon, LOCATION_PRECISION),
+    )
+    if (client := clients.get(key)) is None:
+        client = clients[key] = XweatherlyApiClient(
+            hass, key, entry.data[CONF_CLIENT_ID], entry.data[CONF_CLIENT_SECRET], lat, lon
+        )
+    client.entry_ids.add(entry.entry_id)
+    return client
+
+
+@callback
+def async_release_client(hass: HomeAssistant, client: XweatherlyApiClient, entry_id: str) -> None:
+    """Drop an entry's claim on a shared client, discarding it when unused."""
+    client.entry_ids.discard(entry_id)
+    if not client.entry_ids:
+        hass.data.get(DATA_CLIENTS, {}).pop(client.key, None)
+
+
+class XweatherlyApiClient:
+    """Fetch pipeline for one Xweather account and location.
+
+    The latest response is cached so another entry asking for the same data
+    within its own refresh interval reuses it, and concurrent identical
+    requests are coalesced into a single HTTP call.
+    """
+
+    def __init__(self, hass: HomeAssistant, key, client_id, client_secret, lat, lon):
+        self.hass = hass
+        self.key = key
+        self.session = async_get_clientsession(hass)
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.lat = lat
+        self.lon = lon
+        self.api_base = API_BASE
+        # Config entries currently using this client
+        self.entry_ids = set()
+        # Cache slot -> (fetched at, request key, payload) of the latest good
+        # response. One per endpoint and filter, so requests that vary their
+        # `from` or `fields` params replace each other instead of piling up.
+        self._cache = {}
+        # Request key -> future resolved when the in-flight request completes
+        self._inflight = {}
+        # Statistics label -> EndpointStats
+        self.stats = {}
+
+    def _stats(self, label: str) -> EndpointStats:
+        """Return the statistics recorded under a label."""
+        if (stats := self.stats.get(label)) is None:
+            stats = self.stats[label] = EndpointStats()
+        return stats
+
+    def _cached(self, key, max_age: timedelta):
+        """Return a cached payload no older than max_age, if there is one."""
+        cached = self._cache.get(_cache_slot(key))
+        if (
+            cached is not None
+            and cached[1] == key
+            and dt_util.utcnow() - cached[0] < max_age
+        ):
+            return cached[2]
+        return None
+
+    def _start(self, key):
+        """Register a request as in flight and return its future."""
+        future = self._inflight[key] = self.hass.loop.create_future()
+        return future
+
+    def _finish(self, key, future, result):
+        """Resolve an in-flight request with its payload or exception."""
+        self._inflight.pop(key, None)
+        if isinstance(result, Exception):
+            future.set_exception(result)
+            # Mark retrieved: waiters still receive it, but no one has to
+            future.exception()
+        else:
+            self._cache[_cache_slot(key)] = (dt_util.utcnow(), key, result)
+            future.set_result(result)
+
+    def _abandon(self, keys_futures):
+        """Cancel in-flight requests whose fetch was itself cancelled."""
+        for key, future in keys_futures:
+            self._inflight.pop(key, None)
+            future.cancel()
+
+    @staticmethod
+    async def _wait(future):
+        """Wait for a request started by someone else."""
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled() and not asyncio.current_task().cancelling():
+                raise UpdateFailed("Shared request was cancelled") from None
+            raise
+
+    async def async_fetch(
+        self, endpoint: str, extra_params=None, max_age=timedelta(0), on_billed=None
+    ):
+        """Fetch an endpoint's first response, reusing a fresh or in-flight one.
+
+        `on_billed` is called when the response came from a new HTTP request,
+        as opposed to the cache or another caller's in-flight request.
+        """
+        key = _request_key(endpoint, extra_params)
+        if (payload := self._cached(key, max_age)) is not None:
+            return payload
+        if (future := self._inflight.get(key)) is not None:
+            return await self._wait(future)
+
+        future = self._start(key)
+        try:
+            payload = await self._fetch_with_timeout(endpoint, extra_params)
+        except asyncio.CancelledError:
+            self._abandon([(key, future)])
+            raise
+        except Exception as err:
+            self._finish(key, future, err)
+            raise
+        self._finish(key, future, payload)
+        if on_billed is not None:
+            on_billed()
+        return payload
+
+    async def async_fetch_batch(self, requests, max_age=timedelta(0), on_billed=None):
+        """Fetch several endpoint requests through one Xweather batch request.
+
+        Requests with a fresh cached or in-flight response are not sent
+        again. Returns one result per request, in order: the payload, or the
+        exception describing why that request failed. `on_billed` is called
+        with the position of every request answered by the batch itself.
+        """
+        results = [None] * len(requests)
+        waiting = {}
+        started = {}
+        for index, (endpoint, extra_params) in enumerate(requests):
+            key = _request_key(endpoint, extra_params)
+            if (payload := self._cached(key, max_age)) is not None:
+                results[index] = payload
+            elif (future := self._inflight.get(key)) is not None:
+                waiting[index] = future
+            else:
+                started[index] = (key, self._start(key))
+
+        if started:
+            try:
+                fetched = await self._fetch_batch([requests[index] for index in started])
+            except asyncio.CancelledError:
+                self._abandon(started.values())
+                raise
+            except Exception as err:
+                # E.g. a malformed batch body; every started request failed
+                self._stats("batch").record_error(err)
+                fetched = [err] * len(started)
+            for (index, (key, future)), result in zip(started.items(), fetched):
+                self._finish(key, future, result)
+                results[index] = result
+                if on_billed is not None and not isinstance(result, Exception):
+                    on_billed(index)
+
+        for index, future in waiting.items():
+            try:
+                results[index] = await self._wait(future)
+            except Exception as err:
+                results[index] = err
+        return results
+
+    async def _fetch_with_timeout(self, endpoint: str, extra_params=None):
+        """Fetch an endpoint, giving up after FETCH_TIMEOUT seconds."""
+        try:
+            async with asyncio.timeout(FETCH_TIMEOUT):
+                return await self._fetch(endpoint, extra_params)
+        except TimeoutError as err:
+            failure = UpdateFailed(f"Timed out after {FETCH_TIMEOUT}s fetching {endpoint}")
+            self._stats(_stats_label(endpoint, extra_params)).record_error(failure)
+            raise failure from err
+
+    async def _fetch_batch(self, requests):
+        """Send requests in one Xweather batch request.
+
+        Returns one result per request, in order: the endpoint payload, or the
+        exception describing why that part of the batch failed.
+        """
+        batch = ",".join(_batch_request(*request) for request in requests)
+        try:
+            async with asyncio.timeout(FETCH_TIMEOUT):
+                data = await self._request("batch", {"requests": batch})
+        except TimeoutError:
+            err = UpdateFailed(f"Timed out after {FETCH_TIMEOUT}s fetching batch")
+            self._stats("batch").record_error(err)
+            return [err] * len(requests)
+        except UpdateFailed as err:
+            return [err] * len(requests)
+
+        responses = (data.get("response") or {}).get("responses") or []
+        if len(responses) != len(requests):
+            err = UpdateFailed(
+                f"Batch returned {len(responses)} responses for {len(requests)} requests"
+            )
+            return [err] * len(requests)
+
+        results = []
+        for (endpoint, _), item in zip(requests, responses):
+            try:
+                results.append(_payload(f"Batch request for {endpoint}", item))
+            except XweatherlyNoData as err:
+                results.append(err)
+        return results
+
+    async def _fetch(self, endpoint: str, extra_params=None):
+        """Fetch data from an Xweatherly API endpoint."""
+        data = await self._request(endpoint, extra_params)
+        try:
+            return _payload(endpoint, data)
+        except XweatherlyNoData as err:
+            self._stats(_stats_label(endpoint, extra_params)).record_error(err)
+            raise
+
+    async def async_fetch_list(self, endpoint: str, extra_params=None, on_billed=None):
+        """Fetch every result of an endpoint request, bypassing the cache."""
+        try:
+            async with asyncio.timeout(FETCH_TIMEOUT):
+                data = await self._request(endpoint, extra_params)
+        except TimeoutError as err:
+            failure = UpdateFailed(f"Timed out after {FETCH_TIMEOUT}s fetching {endpoint}")
+            self._stats(_stats_label(endpoint, extra_params)).record_error(failure)
+            raise failure from err
+        if on_billed is not None:
+            on_billed()
+        if not data.get("success", True):
+            error = data.get("error") or {}
+            raise XweatherlyNoData(
+                f"{endpoint} failed: {error.get('description', 'no data returned')}"
+            )
+        response = data.get("response") or []
+        return response if isinstance(response, list) else [response]
+
+    async def _request(self, endpoint: str, extra_params=None):
+        """Issue a GET against an Xweather endpoint and return the decoded body."""
+        params = {
+            "format": "json",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        if extra_params:
+            params.update(extra_params)
+
+        # Requests naming their own location (`p`) query it instead of ours
+        if "p" in params:
+            url = f"{self.api_base}/{endpoint}"
+        else:
+            url = f"{self.api_base}/{endpoint}/{self.lat},{self.lon}"
+        label = _stats_label(endpoint, extra_params)
+        start = time.perf_counter()
+        try:
+            async with self.session.get(url, params=params) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise UpdateFailed(
+                        f"HTTP {resp.status} for {endpoint}: {text[:200]}"
+                    )
+                body = await resp.read()
+        except (aiohttp.ClientError, UpdateFailed) as err:
+            self._stats(label).record_error(err)
+            if isinstance(err, UpdateFailed):
+                raise
+            raise UpdateFailed(f"Error fetching {endpoint}: {err}") from err
+        self._stats(label).record_latency(time.perf_counter() - start)
+        return await self._decode(label, body)
+
+    async def _decode(self, label: str, body: bytes):
+        """Decode a JSON body, off the event loop when it is large.
+
+        Home Assistant's json_loads is backed by orjson; bodies above
+        JSON_EXECUTOR_THRESHOLD bytes are parsed in the executor so long
+        forecast horizons do not stall the event loop.
+        """
+        in_executor = len(body) > JSON_EXECUTOR_THRESHOLD
+        start = time.perf_counter()
+        try:
+            if in_executor:
+                data = await self.hass.async_add_executor_job(json_loads, body)
+            else:
+                data = json_loads(body)
+        except ValueError as err:
+            failure = UpdateFailed(f"Invalid JSON from {label}: {err}")
+            self._stats(label).record_error(failure)
+            raise failure from err
+        self._stats(label).record(len(body), time.perf_counter() - start, in_executor)
+        return data
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BUDGET_MAX_SCALE,
+    BUDGET_MIN_SCALE,
+    BUDGET_PERIOD_DAILY,
+    DOMAIN,
+    ENDPOINT_MULTIPLIERS,
+)
+
+STORAGE_VERSION = 1
+# Seconds to batch counter writes to storage
+STORAGE_SAVE_DELAY = 30
+
+
+def _store_key(entry_id: str) -> str:
+    """Return the storage key holding an entry's usage counters."""
+    return f"{DOMAIN}.{entry_id}.budget"
+
+
+async def async_remove_budget(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete an entry's persisted usage counters."""
+    await Store(hass, STORAGE_VERSION, _store_key(entry_id)).async_remove()
+
+
+def _minutes(interval: timedelta) -> float:
+    """Return an interval in minutes, never less than one."""
+    return max(interval.total_seconds() / 60, 1)
+
+
+class XweatherlyBudget:
+    """Billed Xweather API usage tracked against a daily or monthly allowance.
+
+    Usage is counted in billed calls, i.e. requests weighted by the endpoint
+    multipliers Xweather applies, and persisted so it survives restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, allowance: int, period: str):
+        self.allowance = allowance
+        self.period = period
+        self._store = Store(hass, STORAGE_VERSION, _store_key(entry_id))
+        self.period_start = self._period_start(dt_util.now())
+        # Data key -> billed calls in the current period
+        self.usage = {}
+
+    async def async_load(self) -> None:
+        """Restore the counters of the current period."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        start = dt_util.parse_datetime(stored.get("period_start") or "")
+        if start is not None and start >= self.period_start:
+            self.usage = dict(stored.get("usage", {}))
+
+    @callback
+    def _data_to_store(self):
+        """Return the counters to persist."""
+        return {"period_start": self.period_start.isoformat(), "usage": self.usage}
+
+    def _period_start(self, now: datetime) -> datetime:
+        """Return the local start of the budget period containing now."""
+        start = dt_util.start_of_local_day(now)
+        if self.period == BUDGET_PERIOD_DAILY:
+            return start
+        return start.replace(day=1)
+
+    def _period_end(self) -> datetime:
+        """Return the local end of the current budget period."""
+        if self.period == BUDGET_PERIOD_DAILY:
+            return self.period_start + timedelta(days=1)
+        return (self.period_start + timedelta(days=32)).replace(day=1)
+
+    def _roll_period(self) -> None:
+        """Reset the counters once the current period has ended."""
+        start = self._period_start(dt_util.now())
+        if start != self.period_start:
+            self.period_start = start
+            self.usage = {}
+
+    def configure(self, allowance: int, period: str) -> None:
+        """Apply a changed allowance or budget period."""
+        self.allowance = allowance
+        if period != self.period:
+            self.period = period
+            self._roll_period()
+
+    @callback
+    def record(self, key: str) -> None:
+        """Count one request for a data key that reached Xweather."""
+        self._roll_period()
+        self.usage[key] = self.usage.get(key, 0) + ENDPOINT_MULTIPLIERS[key]
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    @property
+    def used(self) -> int:
+        """Return the billed calls used in the current period."""
+        self._roll_period()
+        return sum(self.usage.values())
+
+    def _remaining_minutes(self) -> float:
+        """Return the minutes left in the current period."""
+        return max((self._period_end() - dt_util.now()).total_seconds() / 60, 1)
+
+    @staticmethod
+    def rate(intervals: dict[str, timedelta]) -> float:
+        """Return the billed calls per minute polling at the given intervals.
+
+        Every data key costs one request per interval; the hourly forecast
+        window plans a single request per cycle to keep it that way.
+        """
+        return sum(
+            ENDPOINT_MULTIPLIERS[key] / _minutes(interval)
+            for key, interval in intervals.items()
+        )
+
+    def projected(self, intervals: dict[str, timedelta]) -> float:
+        """Return the billed calls expected by the end of the period."""
+        return self.used + self.rate(intervals) * self._remaining_minutes()
+
+    def interval_scale(self, intervals: dict[str, timedelta]) -> float:
+        """Return the factor to stretch (>1) or shrink (<1) intervals by.
+
+        The factor spreads what is left of the allowance evenly over what is
+        left of the period, within BUDGET_MIN_SCALE and BUDGET_MAX_SCALE.
+        Without an allowance the configured intervals are used as they are.
+        """
+        if not self.allowance:
+            return 1.0
+        remaining = self.allowance - self.used
+        if remaining <= 0:
+            return BUDGET_MAX_SCALE
+        needed = self.rate(intervals) * self._remaining_minutes()
+        return min(max(needed / remaining, BUDGET_MIN_SCALE), BUDGET_MAX_SCALE)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, DEFAULT_NAME
+from .entity import XweatherlyEntity
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the button platform."""
@@ -10,7 +10,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     async_add_entities([XweatherlyRefreshButton(coordinator, entry)])
 
 
-class XweatherlyRefreshButton(CoordinatorEntity, ButtonEntity):
+class XweatherlyRefreshButton(XweatherlyEntity, ButtonEntity):
     """A button to manually refresh the Xweatherly data."""
 
     def __init__(self, coordinator, entry):
@@ -34,5 +34,5 @@ class XweatherlyRefreshButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_full_refresh()
 
@@ -3,22 +3,65 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     DOMAIN,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
     CONF_UPDATE_INTERVAL,
+    CONF_BATCH_REQUESTS,
+    CONF_CALL_BUDGET,
+    CONF_BUDGET_PERIOD,
+    CONF_FORECAST_HOURS,
+    CONF_FORECAST_EXTRAS,
+    CONF_OBSERVATION_SOURCE,
+    CONF_ENDPOINTS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CONDITIONS_MIN_INTERVAL,
+    CONF_CONDITIONS_MAX_INTERVAL,
+    BUDGET_PERIOD_DAILY,
+    BUDGET_PERIOD_MONTHLY,
     DEFAULT_NAME,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_BATCH_REQUESTS,
+    DEFAULT_CALL_BUDGET,
+    DEFAULT_BUDGET_PERIOD,
+    DEFAULT_FORECAST_HOURS,
+    DEFAULT_FORECAST_EXTRAS,
+    DEFAULT_OBSERVATION_SOURCE,
+    DEFAULT_ENDPOINTS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CONDITIONS_MIN_INTERVAL,
+    DEFAULT_CONDITIONS_MAX_INTERVAL,
+    MAX_FORECAST_HOURS,
+    MIN_UPDATE_INTERVAL,
+    OBSERVATION_SOURCE_MODEL,
+    OBSERVATION_SOURCE_STATION,
+    entry_config,
 )
 
+# Data keys the options can turn off
+ENDPOINT_LABELS = {
+    "conditions": "Current conditions",
+    "airquality": "Air quality",
+    "forecast_hourly": "Hourly forecast",
+    "forecast_daily": "Daily forecast",
+}
+
 
 class XweatherlyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Xweatherly."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for an entry."""
+        return XweatherlyOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         errors = {}
         if user_input is not None:
@@ -33,7 +76,100 @@ class XweatherlyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_LONGITUDE, default=self.hass.config.longitude): float,
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
                 vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): int,
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): bool,
+                vol.Optional(
+                    CONF_CONDITIONS_MIN_INTERVAL, default=DEFAULT_CONDITIONS_MIN_INTERVAL
+                ): vol.All(int, vol.Range(min=MIN_UPDATE_INTERVAL)),
+                vol.Optional(
+                    CONF_CONDITIONS_MAX_INTERVAL, default=DEFAULT_CONDITIONS_MAX_INTERVAL
+                ): vol.All(int, vol.Range(min=MIN_UPDATE_INTERVAL)),
+                vol.Optional(
+                    CONF_OBSERVATION_SOURCE, default=DEFAULT_OBSERVATION_SOURCE
+                ): vol.In([OBSERVATION_SOURCE_MODEL, OBSERVATION_SOURCE_STATION]),
+                vol.Optional(CONF_FORECAST_HOURS, default=DEFAULT_FORECAST_HOURS): vol.All(
+                    int, vol.Range(min=1, max=MAX_FORECAST_HOURS)
+                ),
+                vol.Optional(CONF_FORECAST_EXTRAS, default=DEFAULT_FORECAST_EXTRAS): bool,
+                vol.Optional(CONF_BATCH_REQUESTS, default=DEFAULT_BATCH_REQUESTS): bool,
+                vol.Optional(CONF_CALL_BUDGET, default=DEFAULT_CALL_BUDGET): vol.All(
+                    int, vol.Range(min=0)
+                ),
+                vol.Optional(CONF_BUDGET_PERIOD, default=DEFAULT_BUDGET_PERIOD): vol.In(
+                    [BUDGET_PERIOD_DAILY, BUDGET_PERIOD_MONTHLY]
+                ),
             }
         )
 
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+
+
+class XweatherlyOptionsFlow(config_entries.OptionsFlow):
+    """Change an entry's settings without removing and re-adding it.
+
+    The running coordinator applies the new options in place and refetches
+    only the data they affect; the entities and their registry entries stay.
+    """
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        config = entry_config(self.config_entry)
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_LATITUDE, default=config.get(CONF_LATITUDE, self.hass.config.latitude)
+                ): float,
+                vol.Optional(
+                    CONF_LONGITUDE, default=config.get(CONF_LONGITUDE, self.hass.config.longitude)
+                ): float,
+                vol.Optional(
+                    CONF_UPDATE_INTERVAL,
+                    default=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                ): int,
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=config.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+                ): bool,
+                vol.Optional(
+                    CONF_CONDITIONS_MIN_INTERVAL,
+                    default=config.get(
+                        CONF_CONDITIONS_MIN_INTERVAL, DEFAULT_CONDITIONS_MIN_INTERVAL
+                    ),
+                ): vol.All(int, vol.Range(min=MIN_UPDATE_INTERVAL)),
+                vol.Optional(
+                    CONF_CONDITIONS_MAX_INTERVAL,
+                    default=config.get(
+                        CONF_CONDITIONS_MAX_INTERVAL, DEFAULT_CONDITIONS_MAX_INTERVAL
+                    ),
+                ): vol.All(int, vol.Range(min=MIN_UPDATE_INTERVAL)),
+                vol.Optional(
+                    CONF_ENDPOINTS, default=config.get(CONF_ENDPOINTS, DEFAULT_ENDPOINTS)
+                ): cv.multi_select(ENDPOINT_LABELS),
+                vol.Optional(
+                    CONF_OBSERVATION_SOURCE,
+                    default=config.get(CONF_OBSERVATION_SOURCE, DEFAULT_OBSERVATION_SOURCE),
+                ): vol.In([OBSERVATION_SOURCE_MODEL, OBSERVATION_SOURCE_STATION]),
+                vol.Optional(
+                    CONF_FORECAST_HOURS,
+                    default=config.get(CONF_FORECAST_HOURS, DEFAULT_FORECAST_HOURS),
+                ): vol.All(int, vol.Range(min=1, max=MAX_FORECAST_HOURS)),
+                vol.Optional(
+                    CONF_FORECAST_EXTRAS,
+                    default=config.get(CONF_FORECAST_EXTRAS, DEFAULT_FORECAST_EXTRAS),
+                ): bool,
+                vol.Optional(
+                    CONF_BATCH_REQUESTS,
+                    default=config.get(CONF_BATCH_REQUESTS, DEFAULT_BATCH_REQUESTS),
+                ): bool,
+                vol.Optional(
+                    CONF_CALL_BUDGET, default=config.get(CONF_CALL_BUDGET, DEFAULT_CALL_BUDGET)
+                ): vol.All(int, vol.Range(min=0)),
+                vol.Optional(
+                    CONF_BUDGET_PERIOD,
+                    default=config.get(CONF_BUDGET_PERIOD, DEFAULT_BUDGET_PERIOD),
+                ): vol.In([BUDGET_PERIOD_DAILY, BUDGET_PERIOD_MONTHLY]),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema)
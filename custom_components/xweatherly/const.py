@@ -7,12 +7,192 @@ PLATFORMS = ["weather", "sensor", "air_quality", "button"]
 CONF_CLIENT_ID = "client_id"
 CONF_CLIENT_SECRET = "client_secret"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_BATCH_REQUESTS = "batch_requests"
+CONF_CALL_BUDGET = "call_budget"
+CONF_BUDGET_PERIOD = "budget_period"
+CONF_FORECAST_HOURS = "forecast_hours"
+CONF_FORECAST_EXTRAS = "forecast_extras"
+CONF_OBSERVATION_SOURCE = "observation_source"
+CONF_ENDPOINTS = "endpoints"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_CONDITIONS_MIN_INTERVAL = "conditions_min_interval"
+CONF_CONDITIONS_MAX_INTERVAL = "conditions_max_interval"
+
+BUDGET_PERIOD_DAILY = "daily"
+BUDGET_PERIOD_MONTHLY = "monthly"
+
+# Where current conditions come from: the model at the configured location,
+# or the nearest observation station that passes quality checks
+OBSERVATION_SOURCE_MODEL = "model"
+OBSERVATION_SOURCE_STATION = "station"
 
 DEFAULT_NAME = "Xweatherly"
 DEFAULT_UPDATE_INTERVAL = 60
+DEFAULT_BATCH_REQUESTS = False
+DEFAULT_CALL_BUDGET = 0  # No allowance: track usage but keep configured intervals
+DEFAULT_BUDGET_PERIOD = BUDGET_PERIOD_MONTHLY
+DEFAULT_FORECAST_HOURS = 24
+MAX_FORECAST_HOURS = 240
+DEFAULT_FORECAST_EXTRAS = False
+DEFAULT_OBSERVATION_SOURCE = OBSERVATION_SOURCE_MODEL
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_CONDITIONS_MIN_INTERVAL = 10
+DEFAULT_CONDITIONS_MAX_INTERVAL = 120
 
 API_BASE = "https://data.api.xweather.com"
 
+# Pollutant key normalization for consistency
+POLLUTANT_KEY_MAP = {
+    "pm2.5": "pm25",
+    "pm10": "pm10",
+    "co": "co",
+    "no2": "no2",
+    "so2": "so2",
+    "o3": "o3",
+}
+
+
+def normalize_pollutant_key(name: str) -> str:
+    """Normalize a pollutant type or name, e.g. "PM 2.5" -> "pm25"."""
+    name = name.lower()
+    return POLLUTANT_KEY_MAP.get(name, name.replace(".", "").replace(" ", ""))
+
+
+def entry_config(entry) -> dict:
+    """Return a config entry's settings with its options and defaults applied."""
+    return {**CONFIG_DEFAULTS, **entry.data, **entry.options}
+
+# hass.data key holding the API clients shared between config entries
+DATA_CLIENTS = f"{DOMAIN}_clients"
+
+# Decimal places coordinates are rounded to when matching entries to a shared
+# API client (2 places is roughly 1 km)
+LOCATION_PRECISION = 2
+
+# Seconds allowed for a single endpoint request before it is abandoned
+FETCH_TIMEOUT = 20
+
+# Responses larger than this many bytes are decoded in the executor.
+# Measured with orjson and the benchmark fixtures on one Xeon vCPU: an
+# hourly period is about 0.9 KB and 6 us to decode. A 24-hour forecast
+# (21 KB) takes 0.19 ms, a 240-hour one (217 KB) 1.5 ms, and handing a
+# decode to the executor adds about 0.13 ms. From 64 KB, about 72 hourly
+# periods or a batch carrying them, a decode takes over 0.4 ms on the loop.
+JSON_EXECUTOR_THRESHOLD = 64 * 1024
+
+# Data keys fetched on each refresh: key -> (API endpoint, extra query params)
+ENDPOINTS = {
+    "conditions": ("conditions", None),
+    "airquality": ("airquality", None),
+    "forecast_hourly": ("forecasts", {"filter": "1hr", "limit": 24}),
+    "forecast_daily": ("forecasts", {"filter": "day", "limit": 7}),
+}
+
+# Data keys enabled unless the options turn some off
+DEFAULT_ENDPOINTS = list(ENDPOINTS)
+
+# Effective value of every setting an entry may lack, e.g. because it was
+# created before the setting existed
+CONFIG_DEFAULTS = {
+    CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+    CONF_BATCH_REQUESTS: DEFAULT_BATCH_REQUESTS,
+    CONF_CALL_BUDGET: DEFAULT_CALL_BUDGET,
+    CONF_BUDGET_PERIOD: DEFAULT_BUDGET_PERIOD,
+    CONF_FORECAST_HOURS: DEFAULT_FORECAST_HOURS,
+    CONF_FORECAST_EXTRAS: DEFAULT_FORECAST_EXTRAS,
+    CONF_OBSERVATION_SOURCE: DEFAULT_OBSERVATION_SOURCE,
+    CONF_ENDPOINTS: DEFAULT_ENDPOINTS,
+    CONF_ADAPTIVE_POLLING: DEFAULT_ADAPTIVE_POLLING,
+    CONF_CONDITIONS_MIN_INTERVAL: DEFAULT_CONDITIONS_MIN_INTERVAL,
+    CONF_CONDITIONS_MAX_INTERVAL: DEFAULT_CONDITIONS_MAX_INTERVAL,
+}
+
+# Fields always requested for a data key once requests are projected to the
+# fields the entities read (see XweatherlyEntity._fields)
+BASE_FIELDS = {
+    "conditions": ("timestamp", "dateTimeISO", "weatherPrimaryCoded", "isDay"),
+    "airquality": ("timestamp", "dateTimeISO"),
+    "forecast_hourly": ("timestamp", "dateTimeISO", "weatherPrimaryCoded", "isDay"),
+    "forecast_daily": ("timestamp", "dateTimeISO", "weatherPrimaryCoded", "isDay"),
+}
+
+# Minimum minutes between refreshes of each data key. The configured update
+# interval drives every key whose floor is shorter, so slow-moving data such
+# as the daily forecast is not refetched as often as current conditions.
+ENDPOINT_MIN_INTERVALS = {
+    "conditions": 0,
+    "airquality": 60,
+    "forecast_hourly": 30,
+    "forecast_daily": 180,
+}
+
+# Hourly forecast horizons of FORECAST_INCREMENTAL_HOURS or more are fetched
+# in full every FORECAST_FULL_REFRESH minutes; cycles in between only refetch
+# the near-term FORECAST_REVISE_HOURS, which forecasters still revise. The far
+# end of the window lags by the hours passed since the last full fetch.
+# Shorter horizons are fetched in full every cycle, which costs the same one
+# request.
+FORECAST_INCREMENTAL_HOURS = 48
+FORECAST_REVISE_HOURS = 12
+FORECAST_FULL_REFRESH = 360
+
+# Station observation mode: search radius in km and number of stations
+# listed, minutes before the list is refetched, minutes after which an
+# observation is stale, minutes a failing station is passed over, and the
+# lowest Xweather QC code accepted
+STATION_SEARCH_RADIUS = 25
+STATION_SEARCH_LIMIT = 50
+STATION_LIST_MAX_AGE = 7 * 24 * 60
+STATION_MAX_AGE = 60
+STATION_REJECT_TIME = 6 * 60
+STATION_MIN_QC = 10
+
+# Conditions observations kept for trend sensors, the raw fields recorded for
+# each and the trend windows in hours
+HISTORY_SIZE = 288
+HISTORY_FIELDS = ("pressureMB", "pressureIN", "tempC", "tempF", "windGustMPS", "windGustMPH")
+HISTORY_WINDOWS = (1, 3)
+
+# Seconds between nowcast sensor updates, interpolated locally from the
+# hourly forecast
+NOWCAST_INTERVAL = 60
+
+# Upper bounds, in seconds, of the request latency histogram buckets; slower
+# requests fall in a final overflow bucket
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Fastest any endpoint is polled, in minutes, however much budget is left
+MIN_UPDATE_INTERVAL = 5
+
+# Adaptive polling: hours of hourly forecast looked ahead, and the readings
+# at which each volatility signal counts as fully active
+VOLATILITY_HOURS = 3
+VOLATILITY_POP = 70  # % chance of precipitation
+VOLATILITY_PRESSURE = 3  # hPa change over 3 hours, a rapid tendency
+VOLATILITY_GUST = 15  # m/s, highest gust over 3 hours
+# Weather codes (see ICON_MAP) that mark severe weather
+SEVERE_CODES = ("T", "TOT", "FC", "WP", "AH", "ZR")
+
+# Billed calls Xweather charges per request of each data key. Four requests
+# per update are billed as about 12 calls.
+ENDPOINT_MULTIPLIERS = {
+    "conditions": 3,
+    "airquality": 3,
+    "forecast_hourly": 3,
+    "forecast_daily": 3,
+}
+
+# Bounds on how far the call budget may shrink or stretch the intervals
+BUDGET_MIN_SCALE = 0.25
+BUDGET_MAX_SCALE = 8.0
+
+# Entity tiers. Essential entities are enabled when an entry is added; the
+# rest are registered disabled, and an endpoint none of the enabled entities
+# reads is not fetched at all.
+TIER_ESSENTIAL = "essential"
+TIER_EXTENDED = "extended"
+TIER_DIAGNOSTIC = "diagnostic"
+
 # Map Xweather coded conditions to Home Assistant weather conditions/icons
 ICON_MAP = {
     # Cloud codes
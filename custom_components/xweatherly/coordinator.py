@@ -1,32 +1,157 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import partial
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    EVENT_CORE_CONFIG_UPDATE,
+    UnitOfTemperature,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    BASE_FIELDS,
     DOMAIN,
     DEFAULT_NAME,
-    API_BASE,
-    CONF_CLIENT_ID,
-    CONF_CLIENT_SECRET,
     CONF_UPDATE_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_REQUESTS,
+    CONF_BUDGET_PERIOD,
+    CONF_CALL_BUDGET,
+    CONF_CONDITIONS_MAX_INTERVAL,
+    CONF_CONDITIONS_MIN_INTERVAL,
+    CONF_ENDPOINTS,
+    CONF_FORECAST_EXTRAS,
+    CONF_FORECAST_HOURS,
+    CONF_OBSERVATION_SOURCE,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BATCH_REQUESTS,
+    DEFAULT_BUDGET_PERIOD,
+    DEFAULT_CALL_BUDGET,
+    DEFAULT_CONDITIONS_MAX_INTERVAL,
+    DEFAULT_CONDITIONS_MIN_INTERVAL,
+    DEFAULT_ENDPOINTS,
+    DEFAULT_FORECAST_EXTRAS,
+    DEFAULT_FORECAST_HOURS,
+    DEFAULT_OBSERVATION_SOURCE,
+    DEFAULT_UPDATE_INTERVAL,
+    ENDPOINTS,
+    ENDPOINT_MIN_INTERVALS,
+    MIN_UPDATE_INTERVAL,
+    OBSERVATION_SOURCE_STATION,
+    entry_config,
+    normalize_pollutant_key,
 )
+from .api import XweatherlyNoData, async_get_client, async_release_client
+from .budget import XweatherlyBudget
+from .forecast_columns import ForecastColumns
+from .forecast_window import HourlyForecastWindow
+from .history import ConditionsHistory
+from .nowcast import NowcastEngine
+from .stations import XweatherlyStations
+from .snapshot import ConditionsSnapshot
+from .volatility import VOLATILITY_FIELDS, conditions_interval, volatility_signals
 
 _LOGGER = logging.getLogger(__name__)
 
-# Pollutant key normalization for consistency
-POLLUTANT_KEY_MAP = {
-    "pm2.5": "pm25",
-    "pm10": "pm10",
-    "co": "co",
-    "no2": "no2",
-    "so2": "so2",
-    "o3": "o3",
-}
+STORAGE_VERSION = 1
+# Seconds to batch payload writes to storage
+STORAGE_SAVE_DELAY = 10
+
+# Data keys held as ForecastColumns instead of their raw payload
+FORECAST_KEYS = ("forecast_hourly", "forecast_daily")
+
+# Slack allowed when deciding whether an endpoint is due, so scheduling jitter
+# does not push an endpoint back by a whole tick
+SCHEDULE_TOLERANCE = timedelta(seconds=30)
+
+
+def _normalize_pollutants(airquality):
+    """Index each air quality period's pollutants by normalized key.
+
+    Every pollutant is tagged with its `safe_type`, and each period gets a
+    `pollutant_map` of safe_type -> concentration so entities can look a
+    pollutant up directly instead of scanning the list.
+    """
+    for period in airquality.get("periods") or []:
+        pollutant_map = {}
+        for pol in period.get("pollutants", []):
+            name = pol.get("type") or pol.get("name") or ""
+            safe_type = normalize_pollutant_key(name)
+            if not safe_type:
+                continue
+            pol["safe_type"] = safe_type
+            pollutant_map[safe_type] = next(
+                (
+                    pol[field]
+                    for field in ("valueUGM3", "concentrationUGM3", "value")
+                    if pol.get(field) is not None
+                ),
+                None,
+            )
+        period["pollutant_map"] = pollutant_map
+
+
+def _empty_data() -> dict:
+    """Return coordinator data holding no payload yet."""
+    return {
+        key: ForecastColumns.from_periods([]) if key in FORECAST_KEYS else {}
+        for key in ENDPOINTS
+    }
+
+
+def _store_key(entry_id: str) -> str:
+    """Return the storage key holding an entry's last good payload."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+async def async_remove_stored_data(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete an entry's persisted payload."""
+    await Store(hass, STORAGE_VERSION, _store_key(entry_id)).async_remove()
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Cost of the coordinator's refreshes and the state writes they caused."""
+
+    refreshes: int = 0
+    failures: int = 0
+    last_seconds: float = 0.0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    # Entity state writes so far in the refresh being dispatched
+    state_writes: int = 0
+    last_state_writes: int = 0
+    total_state_writes: int = 0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        """Record one `_async_update_data` run."""
+        self.refreshes += 1
+        self.failures += failed
+        self.last_seconds = seconds
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        """Return the statistics for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_seconds": round(self.last_seconds, 4),
+            "mean_seconds": round(self.total_seconds / self.refreshes, 4) if self.refreshes else None,
+            "max_seconds": round(self.max_seconds, 4),
+            "last_state_writes": self.last_state_writes,
+            "total_state_writes": self.total_state_writes,
+        }
 
 
 class XweatherlyDataCoordinator(DataUpdateCoordinator):
@@ -35,71 +160,609 @@ class XweatherlyDataCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry):
         self.hass = hass
         self.entry = entry
-        self.session = async_get_clientsession(hass)
 
-        self.client_id = entry.data[CONF_CLIENT_ID]
-        self.client_secret = entry.data[CONF_CLIENT_SECRET]
-        self.lat = entry.data.get("latitude", hass.config.latitude)
-        self.lon = entry.data.get("longitude", hass.config.longitude)
-        interval = entry.data.get(CONF_UPDATE_INTERVAL, 60)
+        # Fetch pipeline shared with entries for the same account and location
+        self.client = async_get_client(hass, entry)
+        entry.async_on_unload(
+            lambda: async_release_client(hass, self.client, entry.entry_id)
+        )
+
+        # Entry data with the options applied; see async_apply_options
+        self.config = config = entry_config(entry)
+        self.batch_requests = config.get(CONF_BATCH_REQUESTS, DEFAULT_BATCH_REQUESTS)
+        self.forecast_extras = config.get(CONF_FORECAST_EXTRAS, DEFAULT_FORECAST_EXTRAS)
+        # Data keys the options leave enabled
+        self.enabled_keys = set(config.get(CONF_ENDPOINTS, DEFAULT_ENDPOINTS))
+
+        # Each data key is refreshed on its own cadence; the coordinator ticks
+        # at the fastest one and only fetches the keys that are due. The call
+        # budget stretches or shrinks the configured intervals.
+        self.base_intervals = self._base_intervals()
+        self.endpoint_intervals = dict(self.base_intervals)
+        self.budget = XweatherlyBudget(
+            hass,
+            entry.entry_id,
+            config.get(CONF_CALL_BUDGET, DEFAULT_CALL_BUDGET),
+            config.get(CONF_BUDGET_PERIOD, DEFAULT_BUDGET_PERIOD),
+        )
+        self.fetched_at = {}
+        self._force_refresh = False
+        # Hourly forecast horizon, fetched incrementally after the first load
+        self.hourly_window = HourlyForecastWindow(
+            config.get(CONF_FORECAST_HOURS, DEFAULT_FORECAST_HOURS),
+            ENDPOINTS["forecast_hourly"][1],
+        )
+        # Nearest-station source for conditions, when configured
+        self.stations = self._stations()
+
+        # Payload fields each registered entity reads, per data key. Every
+        # field is requested until projection starts once the platforms are
+        # set up; from then on only the fields the entities need.
+        self._field_consumers = {}
+        self._projecting = False
+        # Data key -> fields requested by its last fetch (None: every field)
+        self.fetched_fields = {}
+
+        # Data keys whose payload changed in the latest refresh, and a per-key
+        # counter bumped on every change, so entities can skip identical data
+        self.changed_sources = set()
+        self.generation = dict.fromkeys(ENDPOINTS, 0)
+        # Refresh timing and state writes, and the last error per data key
+        self.refresh_stats = RefreshStats()
+        self.last_errors = {}
+        # Volatility signals and score steering the conditions interval when
+        # adaptive polling is enabled (None: not scored)
+        self.volatility = {}
+        self.volatility_score = None
+        self._unregister_volatility_fields = None
+        self._configure_adaptive_polling()
+
+        # Current conditions resolved to the active unit system
+        self.is_metric = self._uses_metric()
+        self.snapshot = None
+        # Concentration by normalized pollutant key for the current period
+        self.pollutants = {}
+        # Recent conditions observations the trend sensors read
+        self.history = ConditionsHistory()
+        # Hourly forecast interpolation the nowcast sensors read
+        self.nowcast = NowcastEngine(ForecastColumns.from_periods([]))
+        entry.async_on_unload(
+            hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._handle_core_config_update)
+        )
+
+        # Last good payload persisted for warm starts; `stale` is set while
+        # entities are served from it and no refresh has completed yet
+        self._store = Store(hass, STORAGE_VERSION, _store_key(entry.entry_id))
+        self.stale = False
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=interval),
+            update_interval=min(self.endpoint_intervals.values()),
+        )
+
+    def _base_intervals(self) -> dict[str, timedelta]:
+        """Return every data key's configured refresh interval."""
+        interval = self.config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        return {
+            key: timedelta(minutes=max(interval, ENDPOINT_MIN_INTERVALS[key]))
+            for key in ENDPOINTS
+        }
+
+    def _stations(self) -> XweatherlyStations | None:
+        """Return the station source the configuration asks for, if any."""
+        source = self.config.get(CONF_OBSERVATION_SOURCE, DEFAULT_OBSERVATION_SOURCE)
+        if source != OBSERVATION_SOURCE_STATION:
+            return None
+        return XweatherlyStations(
+            self.config.get(CONF_LATITUDE, self.hass.config.latitude),
+            self.config.get(CONF_LONGITUDE, self.hass.config.longitude),
+        )
+
+    @property
+    def adaptive_polling(self) -> bool:
+        """Return whether the conditions interval follows the volatility score."""
+        return self.config.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+
+    def _configure_adaptive_polling(self) -> None:
+        """Request the fields the volatility signals read while enabled."""
+        if self.adaptive_polling and self._unregister_volatility_fields is None:
+            self._unregister_volatility_fields = self.async_register_fields(
+                {"conditions": VOLATILITY_FIELDS}
+            )
+        elif not self.adaptive_polling and self._unregister_volatility_fields is not None:
+            self._unregister_volatility_fields()
+            self._unregister_volatility_fields = None
+            self.volatility = {}
+            self.volatility_score = None
+            self.changed_sources.add("volatility")
+
+    def _adapt_conditions_interval(self, data) -> None:
+        """Poll conditions faster when the weather is active, slower when calm.
+
+        Sets the base conditions interval between the configured bounds from
+        the volatility score, the strongest of the signals. The call budget
+        still scales the result.
+        """
+        if not self.adaptive_polling:
+            return
+        signals = volatility_signals(
+            data["conditions"],
+            data["forecast_hourly"],
+            self.history,
+            dt_util.utcnow().timestamp(),
+        )
+        score = max(signals.values(), default=0.0)
+        if signals != self.volatility or score != self.volatility_score:
+            self.volatility = signals
+            self.volatility_score = score
+            self.changed_sources.add("volatility")
+        self.base_intervals["conditions"] = max(
+            conditions_interval(
+                score,
+                self.config.get(CONF_CONDITIONS_MIN_INTERVAL, DEFAULT_CONDITIONS_MIN_INTERVAL),
+                self.config.get(CONF_CONDITIONS_MAX_INTERVAL, DEFAULT_CONDITIONS_MAX_INTERVAL),
+            ),
+            timedelta(minutes=MIN_UPDATE_INTERVAL),
+        )
+
+    async def async_apply_options(self) -> None:
+        """Apply changed entry options to the running coordinator.
+
+        Interval, batching, budget and forecast extras changes take effect
+        in place; a new polling interval also reschedules the pending
+        refresh. Only the data keys a change affects are refetched: the
+        conditions for a new observation source, the hourly forecast for a
+        new horizon (in full when it grows), newly enabled endpoints, and everything
+        for a new location. Disabled endpoints drop their data.
+        """
+        # Both sides have the defaults applied, so an option saved for the
+        # first time only counts as a change when its value differs
+        old, config = self.config, entry_config(self.entry)
+        if config == old:
+            return
+        self.config = config
+        changed = {key for key in {*old, *config} if old.get(key) != config.get(key)}
+        refetch = set()
+        update_interval = self.update_interval
+
+        self.batch_requests = config.get(CONF_BATCH_REQUESTS, DEFAULT_BATCH_REQUESTS)
+        self.budget.configure(
+            config.get(CONF_CALL_BUDGET, DEFAULT_CALL_BUDGET),
+            config.get(CONF_BUDGET_PERIOD, DEFAULT_BUDGET_PERIOD),
+        )
+        self.base_intervals = self._base_intervals()
+
+        if changed & {CONF_LATITUDE, CONF_LONGITUDE}:
+            # Another location means another shared client and fresh state
+            async_release_client(self.hass, self.client, self.entry.entry_id)
+            self.client = async_get_client(self.hass, self.entry)
+            self.history = ConditionsHistory()
+            self.hourly_window = HourlyForecastWindow(
+                config.get(CONF_FORECAST_HOURS, DEFAULT_FORECAST_HOURS),
+                ENDPOINTS["forecast_hourly"][1],
+            )
+            self.stations = self._stations()
+            self.fetched_fields.clear()
+            refetch.update(ENDPOINTS)
+        else:
+            if CONF_OBSERVATION_SOURCE in changed:
+                self.stations = self._stations()
+                refetch.add("conditions")
+            if CONF_FORECAST_HOURS in changed:
+                self.hourly_window.resize(
+                    config.get(CONF_FORECAST_HOURS, DEFAULT_FORECAST_HOURS)
+                )
+                refetch.add("forecast_hourly")
+
+        self.changed_sources = set()
+        enabled = set(config.get(CONF_ENDPOINTS, DEFAULT_ENDPOINTS))
+        refetch.update(enabled - self.enabled_keys)
+        if self.data is not None:
+            for key in self.enabled_keys - enabled:
+                self.data[key] = _empty_data()[key]
+                self.fetched_at.pop(key, None)
+                self.changed_sources.add(key)
+                self.generation[key] += 1
+        self.enabled_keys = enabled
+
+        self._configure_adaptive_polling()
+        if self.data is not None:
+            self._adapt_conditions_interval(self.data)
+
+        forecast_extras = config.get(CONF_FORECAST_EXTRAS, DEFAULT_FORECAST_EXTRAS)
+        if forecast_extras != self.forecast_extras:
+            self.forecast_extras = forecast_extras
+            for key in FORECAST_KEYS:
+                self.changed_sources.add(key)
+                self.generation[key] += 1
+
+        for key in refetch:
+            # Never fetched counts as due
+            self.fetched_at.pop(key, None)
+        self._apply_budget()
+        if self.update_interval != update_interval and self._listeners:
+            # The pending refresh was scheduled with the old interval
+            self._schedule_refresh()
+        if self.data is not None:
+            self._update_derived(self.data)
+            self.async_update_listeners()
+        if refetch & self.enabled_keys:
+            await self.async_request_refresh()
+
+    def _uses_metric(self) -> bool:
+        """Return whether Home Assistant is configured for metric units."""
+        return self.hass.config.units.temperature_unit == UnitOfTemperature.CELSIUS
+
+    @callback
+    def _handle_core_config_update(self, event: Event) -> None:
+        """Re-resolve the snapshot when the unit system changes."""
+        is_metric = self._uses_metric()
+        if is_metric == self.is_metric:
+            return
+        self.is_metric = is_metric
+        if self.data:
+            self.snapshot = ConditionsSnapshot.from_conditions(
+                self.data.get("conditions"), is_metric
+            )
+        self.changed_sources = set(ENDPOINTS)
+        self.async_update_listeners()
+
+    async def async_restore(self) -> bool:
+        """Serve the last persisted payload until a refresh completes.
+
+        Returns False when nothing usable was stored, in which case the caller
+        has to wait for a first refresh instead.
+        """
+        stored = await self._store.async_load()
+        if not stored or not stored.get("data"):
+            return False
+
+        data = _empty_data()
+        for key in ENDPOINTS:
+            if key in self.enabled_keys and (payload := stored["data"].get(key)):
+                data[key] = (
+                    ForecastColumns.from_payload(payload) if key in FORECAST_KEYS else payload
+                )
+        for key, fetched in stored.get("fetched_at", {}).items():
+            if key in ENDPOINTS and (fetched_at := dt_util.parse_datetime(fetched)):
+                self.fetched_at[key] = fetched_at
+        for key, fields in stored.get("fields", {}).items():
+            if key in ENDPOINTS:
+                self.fetched_fields[key] = None if fields is None else frozenset(fields)
+
+        self.history.load(stored.get("history") or {})
+        if self.stations is not None:
+            self.stations.load(stored.get("stations") or {})
+        self.changed_sources = set(ENDPOINTS)
+        self._update_derived(data)
+        self._adapt_conditions_interval(data)
+        self.stale = True
+        _LOGGER.debug(
+            "Restored Xweatherly payload saved at %s; refreshing in background",
+            stored.get("saved_at"),
+        )
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def _data_to_store(self):
+        """Return the payload and fetch times to persist."""
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "fetched_at": {key: ts.isoformat() for key, ts in self.fetched_at.items()},
+            "fields": {
+                key: None if fields is None else sorted(fields)
+                for key, fields in self.fetched_fields.items()
+            },
+            "history": self.history.as_dict(),
+            "stations": self.stations.as_dict() if self.stations is not None else None,
+            "data": {
+                key: payload.as_dict() if isinstance(payload, ForecastColumns) else payload
+                for key, payload in self.data.items()
+            },
+        }
+
+    def _update_derived(self, data):
+        """Rebuild the state derived from the data keys that changed."""
+        if "conditions" in self.changed_sources or self.snapshot is None:
+            self.snapshot = ConditionsSnapshot.from_conditions(
+                data["conditions"], self.is_metric
+            )
+            if periods := data["conditions"].get("periods"):
+                self.history.add(periods[0])
+
+        if "forecast_hourly" in self.changed_sources:
+            self.nowcast = NowcastEngine(data["forecast_hourly"])
+
+        if "airquality" in self.changed_sources:
+            periods = data["airquality"].get("periods") or [{}]
+            self.pollutants = periods[0].get("pollutant_map", {})
+
+    @callback
+    def async_register_fields(self, fields) -> CALLBACK_TYPE:
+        """Register the payload fields an entity reads, per data key."""
+        token = object()
+        self._field_consumers[token] = fields
+
+        @callback
+        def _unregister() -> None:
+            self._field_consumers.pop(token, None)
+
+        return _unregister
+
+    @callback
+    def async_start_field_projection(self) -> None:
+        """Request only registered fields from now on.
+
+        Called once the platforms have added their entities. A later refresh
+        refetches any endpoint whose last payload lacks a field that is now
+        required, e.g. after an entity is enabled. Data keys no entity reads
+        stop being fetched.
+        """
+        self._projecting = True
+        self._apply_budget()
+
+    def active_keys(self) -> list[str]:
+        """Return the data keys to fetch: enabled ones some entity reads."""
+        if not self._projecting:
+            return [key for key in ENDPOINTS if key in self.enabled_keys]
+        return [
+            key
+            for key in ENDPOINTS
+            if key in self.enabled_keys
+            and any(key in consumer for consumer in self._field_consumers.values())
+        ]
+
+    def active_intervals(self, intervals=None) -> dict[str, timedelta]:
+        """Return the refresh intervals of the data keys that are fetched."""
+        intervals = self.endpoint_intervals if intervals is None else intervals
+        return {key: intervals[key] for key in self.active_keys()}
+
+    def required_fields(self, key: str) -> frozenset | None:
+        """Return the fields to request for a data key, or None for all."""
+        if not self._projecting:
+            return None
+        fields = set(BASE_FIELDS[key])
+        for consumer in self._field_consumers.values():
+            fields.update(consumer.get(key, ()))
+        return frozenset(fields)
+
+    @staticmethod
+    def _project(params, fields: frozenset | None):
+        """Return request params limited to the given fields."""
+        if fields is None:
+            return params
+        projection = ",".join(sorted(f"periods.{field}" for field in fields))
+        return {**(params or {}), "fields": projection}
+
+    def _request_for(self, key: str, fields: frozenset | None, now, full: bool):
+        """Return the (endpoint, params) request that refreshes a data key."""
+        endpoint, params = ENDPOINTS[key]
+        if key == "conditions" and self._station_mode():
+            # Station observations carry their fields under `ob`, unprojected
+            return self.stations.request()
+        if key == "forecast_hourly":
+            params = self.hourly_window.plan((self.data or {}).get(key), now, full)
+        return endpoint, self._project(params, fields)
+
+    def _station_mode(self) -> bool:
+        """Return whether conditions come from a selected station."""
+        return self.stations is not None and self.stations.station_id is not None
+
+    async def _async_prepare_station(self, now) -> None:
+        """Select a station, fetching the area's station list if needed.
+
+        Conditions fall back to the model for this refresh when no station
+        can be selected.
+        """
+        stations = self.stations
+        if stations.station_id is not None and not stations.needs_list(now):
+            return
+        if stations.needs_list(now):
+            try:
+                observations = await self.client.async_fetch_list(
+                    *stations.list_request(),
+                    on_billed=partial(self._record_billed, "conditions"),
+                )
+            except UpdateFailed as err:
+                _LOGGER.warning("Error listing Xweather stations, using model conditions: %s", err)
+                return
+            stations.load_list(observations, now)
+        if stations.select(now) is None:
+            _LOGGER.debug("No Xweather station passes quality checks, using model conditions")
+        else:
+            _LOGGER.debug(
+                "Using Xweather station %s, %s km away", stations.station_id, stations.distance
+            )
+
+    async def async_request_full_refresh(self):
+        """Request a refresh of every endpoint, due or not."""
+        self._force_refresh = True
+        await self.async_request_refresh()
+
+    @callback
+    def _record_billed(self, key: str) -> None:
+        """Count a request that reached Xweather against the call budget."""
+        self.budget.record(key)
+        self.changed_sources.add("budget")
+
+    def _apply_budget(self) -> None:
+        """Scale the endpoint intervals to fit the remaining call budget."""
+        scale = self.budget.interval_scale(self.active_intervals(self.base_intervals))
+        floor = timedelta(minutes=MIN_UPDATE_INTERVAL)
+        intervals = {
+            key: max(interval * scale, min(floor, interval))
+            for key, interval in self.base_intervals.items()
+        }
+        update_interval = min(
+            (self.active_intervals(intervals) or intervals).values()
         )
+        if intervals != self.endpoint_intervals or update_interval != self.update_interval:
+            _LOGGER.debug("Call budget scales Xweatherly intervals by %.2f", scale)
+            self.endpoint_intervals = intervals
+            self.update_interval = update_interval
+            self.changed_sources.add("budget")
+
+    def _due_endpoints(self, now, fields, active):
+        """Return the active data keys whose interval has elapsed or that lack fields."""
+        due = []
+        for key in active:
+            interval = self.endpoint_intervals[key]
+            fetched = self.fetched_fields.get(key)
+            if (
+                key not in self.fetched_at
+                or now - self.fetched_at[key] >= interval - SCHEDULE_TOLERANCE
+                or (fields[key] is not None and fetched is not None and not fields[key] <= fetched)
+            ):
+                due.append(key)
+        return due
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities, counting the state writes the refresh causes."""
+        stats = self.refresh_stats
+        stats.state_writes = 0
+        super().async_update_listeners()
+        stats.last_state_writes = stats.state_writes
+        stats.total_state_writes += stats.state_writes
 
     async def _async_update_data(self):
-        """Fetch and normalize Xweatherly data."""
+        """Fetch and normalize Xweatherly data, timing the refresh."""
+        start = time.perf_counter()
+        failed = True
         try:
-            conditions = await self._fetch("conditions")
-            airquality = await self._fetch("airquality")
-            forecast_hourly = await self._fetch(
-                "forecasts", {"filter": "1hr", "limit": 24}
+            data = await self._async_fetch_data()
+            failed = False
+            return data
+        finally:
+            self.refresh_stats.record(time.perf_counter() - start, failed)
+            self.changed_sources.add("stats")
+
+    async def _async_fetch_data(self):
+        """Fetch and normalize Xweatherly data.
+
+        Only the endpoints that are due are requested, concurrently or in a
+        single batch request when batch mode is enabled; endpoints no entity
+        reads are skipped altogether, and the hourly forecast only fetches the
+        hours its window needs revised or added. An endpoint that fails keeps
+        its last good payload so one bad call does not take every entity down;
+        the refresh only fails when no due endpoint could be fetched.
+        """
+        now = dt_util.utcnow()
+        force, self._force_refresh = self._force_refresh, False
+        fields = {key: self.required_fields(key) for key in ENDPOINTS}
+        active = self.active_keys()
+        keys = active if force else self._due_endpoints(now, fields, active)
+        self.changed_sources = set()
+
+        data = _empty_data()
+        data.update(self.data or {})
+        if not keys:
+            self._clear_stale()
+            return data
+
+        # A response another entry fetched within this entry's own interval
+        # is as fresh as fetching it again would make it
+        max_age = {
+            key: timedelta(0) if force else self.endpoint_intervals[key] - SCHEDULE_TOLERANCE
+            for key in keys
+        }
+        if self.stations is not None and "conditions" in keys:
+            await self._async_prepare_station(now)
+
+        # One request per data key, so each costs one call per interval as
+        # the call budget assumes. Changed fields need a full refetch so
+        # every period carries them.
+        requests = {
+            key: self._request_for(
+                key, fields[key], now, force or fields[key] != self.fetched_fields.get(key)
             )
-            forecast_daily = await self._fetch(
-                "forecasts", {"filter": "day", "limit": 7}
+            for key in keys
+        }
+        if self.batch_requests:
+            results = await self.client.async_fetch_batch(
+                list(requests.values()),
+                min(max_age.values()),
+                on_billed=lambda index: self._record_billed(keys[index]),
+            )
+        else:
+            results = await asyncio.gather(
+                *(
+                    self.client.async_fetch(
+                        *requests[key],
+                        max_age=max_age[key],
+                        on_billed=partial(self._record_billed, key),
+                    )
+                    for key in keys
+                ),
+                return_exceptions=True,
             )
 
-            # Normalize pollutants in air quality data
-            if airquality and "periods" in airquality and airquality["periods"]:
-                for period in airquality["periods"]:
-                    pollutants = period.get("pollutants", [])
-                    normalized_pollutants = []
-                    for pol in pollutants:
-                        original_type = pol.get("type", "").lower()
-                        safe_type = POLLUTANT_KEY_MAP.get(original_type, original_type)
-                        pol["safe_type"] = safe_type
-                        normalized_pollutants.append(pol)
-                    period["pollutants"] = normalized_pollutants
-
-            return {
-                "conditions": conditions,
-                "airquality": airquality,
-                "forecast_hourly": forecast_hourly,
-                "forecast_daily": forecast_daily,
-            }
-
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching Xweatherly data: {err}") from err
-
-    async def _fetch(self, endpoint: str, extra_params=None):
-        """Fetch data from an Xweatherly API endpoint."""
-        params = {
-            "format": "json",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-        }
-        if extra_params:
-            params.update(extra_params)
-
-        url = f"{API_BASE}/{endpoint}/{self.lat},{self.lon}"
-        async with self.session.get(url, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise UpdateFailed(
-                    f"HTTP {resp.status} for {endpoint}: {text[:200]}"
+        errors = {}
+        for key, part in zip(keys, results):
+            if isinstance(part, asyncio.CancelledError):
+                raise part
+            station = key == "conditions" and requests[key][0] == "observations"
+            if isinstance(part, Exception):
+                errors[key] = part
+                # Only a station without data is replaced; transport errors
+                # keep it, so one timeout does not bench the nearest station
+                if station and isinstance(part, XweatherlyNoData):
+                    self.stations.reject(now)
+                continue
+            if key == "forecast_hourly":
+                result = self.hourly_window.merge(data[key], requests[key][1], part, now)
+            elif station:
+                result = self.stations.to_conditions(
+                    part, now, self.nowcast.code(now.timestamp())
                 )
-            data = await resp.json()
-            return data.get("response", [{}])[0]
+                if result is None:
+                    errors[key] = UpdateFailed(
+                        f"Station {self.stations.station_id} observation is stale "
+                        "or failed quality checks"
+                    )
+                    self.stations.reject(now)
+                    continue
+            else:
+                result = part
+            if key in FORECAST_KEYS:
+                result = ForecastColumns.from_payload(result, fields[key])
+                result.add_derived()
+            if key == "airquality":
+                _normalize_pollutants(result)
+            self.fetched_at[key] = now
+            self.fetched_fields[key] = fields[key]
+            if result != data[key]:
+                data[key] = result
+                self.changed_sources.add(key)
+                self.generation[key] += 1
+
+        self._update_derived(data)
+        self._adapt_conditions_interval(data)
+        for key, err in errors.items():
+            self.last_errors[key] = {"error": str(err), "at": now.isoformat()}
+
+        if len(errors) == len(keys):
+            raise UpdateFailed(
+                "Error fetching Xweatherly data: "
+                + "; ".join(f"{key}: {err}" for key, err in errors.items())
+            )
+        for key, err in errors.items():
+            _LOGGER.warning(
+                "Error fetching Xweatherly %s data, keeping last good payload: %s",
+                key,
+                err,
+            )
+
+        self._apply_budget()
+        self._clear_stale()
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return data
+
+    def _clear_stale(self):
+        """Mark restored data as confirmed so every entity re-renders once."""
+        if self.stale:
+            self.stale = False
+            self.changed_sources = {*ENDPOINTS, "budget", "volatility"}
@@ -0,0 +1,115 @@
+"""Comfort and moisture metrics derived from temperature, humidity and wind."""
+from __future__ import annotations
+
+import math
+from array import array
+
+# Derived metric -> (metric key, imperial key). Temperatures get a Fahrenheit
+# key; the others read the same in both unit systems.
+DERIVED_FIELDS = {
+    "heat_index": ("heatIndexC", "heatIndexF"),
+    "wind_chill": ("windChillC", "windChillF"),
+    "wet_bulb": ("wetBulbC", "wetBulbF"),
+    "apparent_temperature": ("apparentTempC", "apparentTempF"),
+    "absolute_humidity": ("absHumidityGM3", "absHumidityGM3"),
+    "vapor_pressure_deficit": ("vpdKPA", "vpdKPA"),
+}
+
+# Raw period fields every derived metric is computed from
+DERIVED_INPUTS = ("tempC", "humidity", "windSpeedMPS")
+
+_TEMPERATURES = ("heat_index", "wind_chill", "wet_bulb", "apparent_temperature")
+
+
+def _heat_index(temp: float, rh: float) -> float:
+    """NWS heat index in °C; the air temperature where it does not apply."""
+    temp_f = temp * 9 / 5 + 32
+    simple = 0.5 * (temp_f + 61 + (temp_f - 68) * 1.2 + rh * 0.094)
+    if (simple + temp_f) / 2 < 80:
+        return temp
+    index = (
+        -42.379
+        + 2.04901523 * temp_f
+        + 10.14333127 * rh
+        - 0.22475541 * temp_f * rh
+        - 0.00683783 * temp_f * temp_f
+        - 0.05481717 * rh * rh
+        + 0.00122874 * temp_f * temp_f * rh
+        + 0.00085282 * temp_f * rh * rh
+        - 0.00000199 * temp_f * temp_f * rh * rh
+    )
+    if rh < 13 and 80 <= temp_f <= 112:
+        index -= (13 - rh) / 4 * math.sqrt((17 - abs(temp_f - 95)) / 17)
+    elif rh > 85 and 80 <= temp_f <= 87:
+        index += (rh - 85) / 10 * (87 - temp_f) / 5
+    return (index - 32) * 5 / 9
+
+
+def _wind_chill(temp: float, wind: float) -> float:
+    """Environment Canada wind chill in °C; the air temperature outside its range."""
+    wind_kph = wind * 3.6
+    if temp > 10 or wind_kph <= 4.8:
+        return temp
+    factor = wind_kph**0.16
+    return 13.12 + 0.6215 * temp - 11.37 * factor + 0.3965 * temp * factor
+
+
+def _wet_bulb(temp: float, rh: float) -> float:
+    """Stull (2011) wet-bulb temperature in °C."""
+    return (
+        temp * math.atan(0.151977 * math.sqrt(rh + 8.313659))
+        + math.atan(temp + rh)
+        - math.atan(rh - 1.676331)
+        + 0.00391838 * rh**1.5 * math.atan(0.023101 * rh)
+        - 4.686035
+    )
+
+
+def _metrics(temp: float, rh: float, wind: float) -> tuple[float, ...]:
+    """Return every derived metric, metric units, in DERIVED_FIELDS order."""
+    if math.isnan(temp) or math.isnan(rh):
+        return (math.nan,) * len(DERIVED_FIELDS)
+    saturation = 6.112 * math.exp(17.67 * temp / (temp + 243.5))  # hPa
+    vapor = rh / 100 * saturation
+    return (
+        _heat_index(temp, rh),
+        math.nan if math.isnan(wind) else _wind_chill(temp, wind),
+        _wet_bulb(temp, rh),
+        math.nan if math.isnan(wind) else temp + 0.33 * vapor - 0.70 * wind - 4.00,
+        216.7 * vapor / (273.15 + temp),
+        (saturation - vapor) / 10,
+    )
+
+
+def derive(temps, humidity, wind) -> dict[str, array]:
+    """Compute every derived metric for aligned input sequences in one pass.
+
+    Inputs use NaN (or None) for missing values. Returns a double array per
+    DERIVED_FIELDS key, rounded to one decimal (two for the deficit), with
+    NaN wherever an input was missing.
+    """
+    def _float(value):
+        return math.nan if value is None else float(value)
+
+    rows = [
+        _metrics(_float(temp), _float(rh), _float(speed))
+        for temp, rh, speed in zip(temps, humidity, wind)
+    ]
+    columns = {}
+    for position, (name, (metric_key, imperial_key)) in enumerate(DERIVED_FIELDS.items()):
+        digits = 2 if name == "vapor_pressure_deficit" else 1
+        values = [row[position] for row in rows]
+        columns[metric_key] = array("d", (round(value, digits) for value in values))
+        if name in _TEMPERATURES:
+            columns[imperial_key] = array(
+                "d", (round(value * 9 / 5 + 32, 1) for value in values)
+            )
+    return columns
+
+
+def derive_period(period) -> dict:
+    """Return the derived metrics of a single period, None where unknown."""
+    columns = derive(*([period.get(field)] for field in DERIVED_INPUTS))
+    return {
+        key: None if math.isnan(values[0]) else values[0] for key, values in columns.items()
+    }
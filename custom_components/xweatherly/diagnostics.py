@@ -0,0 +1,69 @@
+"""Diagnostics support for Xweatherly."""
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, DOMAIN
+from .coordinator import FORECAST_KEYS
+
+TO_REDACT = {CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry) -> dict:
+    """Return the entry's configuration, schedule and fetch statistics."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    budget = coordinator.budget
+    stations = coordinator.stations
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "schedule": {
+            "active_keys": coordinator.active_keys(),
+            "update_interval_minutes": {
+                key: interval.total_seconds() / 60
+                for key, interval in coordinator.endpoint_intervals.items()
+            },
+            "fetched_at": {key: at.isoformat() for key, at in coordinator.fetched_at.items()},
+            "fetched_fields": {
+                key: None if fields is None else sorted(fields)
+                for key, fields in coordinator.fetched_fields.items()
+            },
+            "generation": dict(coordinator.generation),
+        },
+        "budget": {
+            "allowance": budget.allowance or None,
+            "period": budget.period,
+            "period_start": budget.period_start.isoformat(),
+            "used": budget.used,
+            "usage_by_endpoint": dict(budget.usage),
+        },
+        "volatility": {
+            "adaptive_polling": coordinator.adaptive_polling,
+            "score": coordinator.volatility_score,
+            "signals": dict(coordinator.volatility),
+        },
+        "refresh": coordinator.refresh_stats.as_dict(),
+        "last_errors": dict(coordinator.last_errors),
+        "endpoints": {
+            label: stats.as_dict() for label, stats in coordinator.client.stats.items()
+        },
+        "data": {
+            "stale": coordinator.stale,
+            "periods": {
+                key: len(value) if key in FORECAST_KEYS else None
+                for key, value in (coordinator.data or {}).items()
+            },
+            "history_observations": coordinator.history.count,
+            "station": None
+            if stations is None
+            else {
+                "listed": len(stations.stations),
+                "selected": stations.station_id is not None,
+                "distance_km": stations.distance,
+            },
+        },
+    }
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import TIER_ESSENTIAL
+
+
+class XweatherlyEntity(CoordinatorEntity):
+    """Base class for Xweatherly entities that only write changed state."""
+
+    # Coordinator data keys this entity renders from
+    _sources: tuple[str, ...] = ()
+    # Payload fields this entity reads, per data key, so requests can be
+    # limited to the fields enabled entities actually use
+    _fields: dict[str, tuple[str, ...]] = {}
+    # Only essential entities are enabled when first registered
+    _tier: str = TIER_ESSENTIAL
+
+    def __init__(self, coordinator):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_fingerprint = None
+        self._last_update_success = None
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return whether the entity is enabled when first registered."""
+        return self._tier == TIER_ESSENTIAL
+
+    def _state_fingerprint(self):
+        """Return a comparable snapshot of everything this entity renders."""
+        if not self.available:
+            return (False,)
+        return (
+            True,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.unit_of_measurement,
+        )
+
+    @property
+    def extra_state_attributes(self):
+        """Flag state served from the persisted payload before a refresh."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the fields we read and record the state written on add."""
+        await super().async_added_to_hass()
+        if self._fields:
+            self.async_on_remove(self.coordinator.async_register_fields(self._fields))
+        self._last_fingerprint = self._state_fingerprint()
+        self._last_update_success = self.coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when one of our sources changed our value."""
+        success = self.coordinator.last_update_success
+        if success == self._last_update_success and self.coordinator.changed_sources.isdisjoint(
+            self._sources
+        ):
+            return
+        self._last_update_success = success
+
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        self.coordinator.refresh_stats.state_writes += 1
+        self.async_write_ha_state()
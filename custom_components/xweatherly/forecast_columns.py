@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import datetime, timezone
+
+from .derived import DERIVED_INPUTS, derive
+from .snapshot import condition_from_period, weather_code
+
+# Stands in for a missing value in integer columns
+INT_MISSING = -(2**31)
+
+# Home Assistant conditions and Xweather weather codes, each interned as
+# small ints shared by every store
+_CONDITIONS: list[str | None] = []
+_CONDITION_INDEX: dict[str | None, int] = {}
+_CODES: list[str | None] = []
+_CODE_INDEX: dict[str | None, int] = {}
+
+
+def _intern(values: list, index: dict, value) -> int:
+    """Return the small int standing for a value in an intern table."""
+    if (position := index.get(value)) is None:
+        position = index[value] = len(values)
+        values.append(value)
+    return position
+
+
+def _column(values):
+    """Pack a field's values into a typed array, or None if it has none.
+
+    Integer fields use a 32-bit column with INT_MISSING for gaps, anything
+    else numeric a double column with NaN for gaps. Non-numeric fields are
+    not stored.
+    """
+    present = [value for value in values if value is not None]
+    if not present or any(
+        isinstance(value, bool) or not isinstance(value, (int, float)) for value in present
+    ):
+        return None
+    if all(isinstance(value, int) and abs(value) < 2**31 - 1 for value in present):
+        return array("i", (INT_MISSING if value is None else value for value in values))
+    return array("d", (math.nan if value is None else value for value in values))
+
+
+def _unpack(column, index: int):
+    """Return one value of a column, None when missing."""
+    value = column[index]
+    if column.typecode == "i":
+        return None if value == INT_MISSING else value
+    return None if math.isnan(value) else value
+
+
+class ForecastColumns:
+    """Forecast periods held column-wise in typed arrays.
+
+    Replaces the raw list of per-period dicts: each numeric field is one
+    array, the condition and the Xweather weather code are interned small
+    ints and the period start a unix timestamp, so memory per period is a
+    few bytes per field.
+    """
+
+    __slots__ = ("timestamps", "conditions", "codes", "columns", "tzinfo")
+
+    def __init__(self, timestamps, conditions, codes, columns, tzinfo=timezone.utc):
+        self.timestamps = timestamps
+        self.conditions = conditions
+        self.codes = codes
+        self.columns = columns
+        self.tzinfo = tzinfo
+
+    @classmethod
+    def from_periods(cls, periods, fields=None) -> ForecastColumns:
+        """Build the store from forecast periods.
+
+        `fields` limits the columns kept; by default every numeric field is.
+        Periods produced by `periods()` carry their resolved `condition`.
+        """
+        periods = [period for period in periods or [] if period.get("timestamp") is not None]
+        tzinfo = timezone.utc
+        if periods and (iso := periods[0].get("dateTimeISO")):
+            try:
+                tzinfo = datetime.fromisoformat(iso).tzinfo or timezone.utc
+            except ValueError:
+                pass
+        if fields is None:
+            fields = {field for period in periods for field in period}
+        columns = {}
+        for field in fields:
+            if field in ("timestamp", "condition"):
+                continue
+            column = _column([period.get(field) for period in periods])
+            if column is not None:
+                columns[field] = column
+        return cls(
+            array("q", (period["timestamp"] for period in periods)),
+            array(
+                "B",
+                (
+                    _intern(
+                        _CONDITIONS,
+                        _CONDITION_INDEX,
+                        period.get("condition") or condition_from_period(period),
+                    )
+                    for period in periods
+                ),
+            ),
+            array("B", (_intern(_CODES, _CODE_INDEX, weather_code(period)) for period in periods)),
+            columns,
+            tzinfo,
+        )
+
+    @classmethod
+    def from_payload(cls, payload, fields=None) -> ForecastColumns:
+        """Build the store from an endpoint payload or a stored `as_dict()`."""
+        return cls.from_periods((payload or {}).get("periods"), fields)
+
+    def add_derived(self) -> None:
+        """Add the derived metric columns computed from this store's inputs."""
+        if all(field in self.columns for field in DERIVED_INPUTS[:2]):
+            self.columns.update(derive(*(self.values(field) for field in DERIVED_INPUTS)))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ForecastColumns):
+            return NotImplemented
+        return (
+            self.timestamps == other.timestamps
+            and self.conditions == other.conditions
+            and self.codes == other.codes
+            and self.columns.keys() == other.columns.keys()
+            # Compare raw bytes so NaN gaps compare equal
+            and all(
+                column.tobytes() == other.columns[field].tobytes()
+                for field, column in self.columns.items()
+            )
+        )
+
+    def datetime_iso(self, index: int) -> str:
+        """Return a period's start as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.timestamps[index], self.tzinfo).isoformat()
+
+    def condition(self, index: int) -> str | None:
+        """Return a period's Home Assistant condition."""
+        return _CONDITIONS[self.conditions[index]]
+
+    def code(self, index: int) -> str | None:
+        """Return a period's Xweather weather code, e.g. `RW`."""
+        return _CODES[self.codes[index]]
+
+    def value(self, field: str, index: int):
+        """Return one field of one period, None when missing."""
+        column = self.columns.get(field)
+        if column is None or index >= len(self.timestamps):
+            return None
+        return _unpack(column, index)
+
+    def values(self, field: str) -> list:
+        """Return a field for every period, None where missing."""
+        column = self.columns.get(field)
+        if column is None:
+            return [None] * len(self.timestamps)
+        return [_unpack(column, index) for index in range(len(column))]
+
+    def periods(self) -> list[dict]:
+        """Return the periods as dicts, e.g. to merge or persist them."""
+        return [
+            {
+                "timestamp": ts,
+                "dateTimeISO": self.datetime_iso(index),
+                "condition": self.condition(index),
+                **(
+                    {"weatherPrimaryCoded": f"::{code}"}
+                    if (code := self.code(index)) is not None
+                    else {}
+                ),
+                **{
+                    field: value
+                    for field, column in self.columns.items()
+                    if (value := _unpack(column, index)) is not None
+                },
+            }
+            for index, ts in enumerate(self.timestamps)
+        ]
+
+    def as_dict(self) -> dict:
+        """Return a JSON-serializable form that `from_payload` reads back."""
+        return {"periods": self.periods()}
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from .const import (
+    FORECAST_FULL_REFRESH,
+    FORECAST_INCREMENTAL_HOURS,
+    FORECAST_REVISE_HOURS,
+)
+from .forecast_columns import ForecastColumns
+
+HOUR = 3600
+
+
+def _hour_start(now: datetime) -> int:
+    """Return the unix timestamp of the start of the current hour."""
+    ts = int(now.timestamp())
+    return ts - ts % HOUR
+
+
+def _upcoming(window: ForecastColumns | None, start: int) -> list:
+    """Return the periods of the current window from the given hour on."""
+    periods = window.periods() if window else []
+    return [period for period in periods if period["timestamp"] >= start]
+
+
+class HourlyForecastWindow:
+    """Hourly forecast horizon kept in memory and revised incrementally.
+
+    A full fetch loads the whole horizon. With a long horizon, later cycles
+    only request the near-term hours, whose forecast still moves, using
+    Xweather `from` paging, and merge them into the window by period
+    timestamp. Every cycle is a single request, like any other data key, so
+    the call budget's rate holds; hours that came into the horizon since the
+    last full fetch are picked up by the next one.
+    """
+
+    def __init__(self, hours: int, params: dict) -> None:
+        self.hours = hours
+        self.params = {**params, "limit": hours}
+        self.full_at = None
+
+    def resize(self, hours: int) -> None:
+        """Change the horizon; a longer one is fetched in full next time."""
+        if hours > self.hours:
+            self.full_at = None
+        self.hours = hours
+        self.params = {**self.params, "limit": hours}
+
+    def plan(self, window, now: datetime, full: bool = False) -> dict:
+        """Return the params of the request that brings the window up to date."""
+        start = _hour_start(now)
+        periods = _upcoming(window, start)
+        if (
+            full
+            or self.hours < FORECAST_INCREMENTAL_HOURS
+            or self.full_at is None
+            or now - self.full_at >= timedelta(minutes=FORECAST_FULL_REFRESH)
+            # The window must cover the hours being revised, without a gap
+            or len(periods) < FORECAST_REVISE_HOURS
+            or periods[0]["timestamp"] > start
+        ):
+            return self.params
+        return {**self.params, "from": start, "limit": FORECAST_REVISE_HOURS}
+
+    def merge(self, window, request: dict, payload, now: datetime):
+        """Return the payload of the window updated with a planned response."""
+        if "from" not in request:
+            self.full_at = now
+            return payload
+
+        start = _hour_start(now)
+        end = start + self.hours * HOUR
+        merged = {period["timestamp"]: period for period in _upcoming(window, start)}
+        for period in payload.get("periods") or []:
+            if (ts := period.get("timestamp")) is not None:
+                merged[ts] = period
+        return {
+            **payload,
+            "periods": [merged[ts] for ts in sorted(merged) if ts < end],
+        }
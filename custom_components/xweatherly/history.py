@@ -0,0 +1,136 @@
+"""Ring buffer of recent conditions observations and the trends over it."""
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+
+from .const import HISTORY_FIELDS, HISTORY_SIZE, HISTORY_WINDOWS
+
+# A change is only reported when its base observation is at most this much
+# older than the window, e.g. not after polling stopped for a day
+MAX_WINDOW_OVERRUN = 1.5
+
+
+class ConditionsHistory:
+    """Fixed-size, array-backed ring buffer of conditions observations.
+
+    Each observation stores its timestamp and the HISTORY_FIELDS values.
+    Trends are maintained incrementally as observations are added: for
+    every window a pointer to the newest observation at least that old, and
+    for every field and window a monotonic deque of the window's maximum.
+    Reading a trend never scans the buffer.
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE, fields=HISTORY_FIELDS, windows=HISTORY_WINDOWS):
+        self.size = size
+        self.fields = tuple(fields)
+        self.windows = tuple(int(hours * 3600) for hours in windows)
+        self.timestamps = array("q", bytes(8 * size))
+        self.columns = {field: array("d", [math.nan]) * size for field in self.fields}
+        # Observations ever added; observation n lives in slot n % size
+        self.count = 0
+        # Window -> number of the newest observation at least a window older
+        # than the latest one (-1: none yet)
+        self._base = dict.fromkeys(self.windows, -1)
+        # (field, window) -> observation numbers whose values may still be
+        # the window's maximum, in decreasing value order
+        self._max = {(field, window): deque() for field in self.fields for window in self.windows}
+
+    @property
+    def _oldest(self) -> int:
+        """Return the number of the oldest observation still held."""
+        return max(self.count - self.size, 0)
+
+    def _ts(self, number: int) -> int:
+        return self.timestamps[number % self.size]
+
+    def _value(self, field: str, number: int) -> float:
+        return self.columns[field][number % self.size]
+
+    def add(self, period) -> bool:
+        """Record a conditions period; return False if it is not newer."""
+        ts = period.get("timestamp")
+        if ts is None or (self.count and ts <= self._ts(self.count - 1)):
+            return False
+
+        number = self.count
+        slot = number % self.size
+        self.timestamps[slot] = ts
+        for field, column in self.columns.items():
+            value = period.get(field)
+            column[slot] = math.nan if value is None else value
+        self.count += 1
+        oldest = self._oldest
+
+        for window in self.windows:
+            base = max(self._base[window], oldest - 1)
+            while base + 1 < number and self._ts(base + 1) <= ts - window:
+                base += 1
+            self._base[window] = base
+
+            for field in self.fields:
+                candidates = self._max[(field, window)]
+                value = self._value(field, number)
+                if not math.isnan(value):
+                    while candidates and self._value(field, candidates[-1]) <= value:
+                        candidates.pop()
+                    candidates.append(number)
+                while candidates and (
+                    candidates[0] < oldest or self._ts(candidates[0]) <= ts - window
+                ):
+                    candidates.popleft()
+        return True
+
+    def _span(self, window: int):
+        """Return (base observation, seconds) a window's change spans, if any."""
+        base = self._base[window]
+        if self.count == 0 or base < self._oldest:
+            return None
+        elapsed = self._ts(self.count - 1) - self._ts(base)
+        if elapsed > window * MAX_WINDOW_OVERRUN:
+            return None
+        return base, elapsed
+
+    def change(self, field: str, hours: float):
+        """Return the change of a field over the window, None if unknown."""
+        if (span := self._span(int(hours * 3600))) is None:
+            return None
+        delta = self._value(field, self.count - 1) - self._value(field, span[0])
+        return None if math.isnan(delta) else delta
+
+    def rate(self, field: str, hours: float):
+        """Return a field's change per hour over the window, None if unknown."""
+        if (span := self._span(int(hours * 3600))) is None:
+            return None
+        delta = self._value(field, self.count - 1) - self._value(field, span[0])
+        return None if math.isnan(delta) else delta * 3600 / span[1]
+
+    def maximum(self, field: str, hours: float):
+        """Return a field's maximum over the window, None if unknown."""
+        candidates = self._max[(field, int(hours * 3600))]
+        return self._value(field, candidates[0]) if candidates else None
+
+    def as_dict(self) -> dict:
+        """Return the held observations, oldest first, for storage."""
+        numbers = range(self._oldest, self.count)
+        return {
+            "timestamps": [self._ts(number) for number in numbers],
+            "fields": {
+                field: [
+                    None if math.isnan(value := self._value(field, number)) else value
+                    for number in numbers
+                ]
+                for field in self.fields
+            },
+        }
+
+    def load(self, stored) -> None:
+        """Replay stored observations through `add`."""
+        fields = stored.get("fields", {})
+        for index, ts in enumerate(stored.get("timestamps", [])):
+            period = {"timestamp": ts}
+            for field, values in fields.items():
+                if field in self.columns and index < len(values):
+                    period[field] = values[index]
+            self.add(period)
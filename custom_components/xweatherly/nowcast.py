@@ -0,0 +1,74 @@
+"""Minute-resolution nowcast interpolated from the hourly forecast."""
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+
+from .forecast_columns import ForecastColumns
+
+
+class NowcastEngine:
+    """Interpolates the hourly forecast to any moment inside its window.
+
+    Numeric fields are interpolated linearly between hourly periods and the
+    condition is stepped, i.e. the condition of the period the moment falls
+    in. Each field's values and per-segment slopes are packed into arrays in
+    one pass the first time it is read, so every later evaluation is a
+    bisect plus one multiply-add. An engine is built per hourly forecast
+    generation and costs no network traffic.
+    """
+
+    __slots__ = ("columns", "_segments")
+
+    def __init__(self, columns: ForecastColumns) -> None:
+        self.columns = columns
+        # Field -> (values, slopes per second) arrays
+        self._segments = {}
+
+    def _segments_for(self, field: str):
+        """Return a field's values and slopes, packing them on first use."""
+        if (segments := self._segments.get(field)) is None:
+            timestamps = self.columns.timestamps
+            values = array(
+                "d", (math.nan if value is None else value for value in self.columns.values(field))
+            )
+            slopes = array(
+                "d",
+                (
+                    (values[i + 1] - values[i]) / (timestamps[i + 1] - timestamps[i])
+                    for i in range(len(values) - 1)
+                ),
+            )
+            segments = self._segments[field] = (values, slopes)
+        return segments
+
+    def _index(self, ts: float) -> int | None:
+        """Return the period a moment falls in, None outside the window."""
+        timestamps = self.columns.timestamps
+        index = bisect_right(timestamps, ts) - 1
+        if index < 0 or (index == len(timestamps) - 1 and ts > timestamps[index]):
+            return None
+        return index
+
+    def value(self, field: str, ts: float):
+        """Return a field interpolated to a unix time, None if unknown."""
+        if (index := self._index(ts)) is None:
+            return None
+        values, slopes = self._segments_for(field)
+        value = values[index]
+        if index < len(slopes):
+            value += slopes[index] * (ts - self.columns.timestamps[index])
+        return None if math.isnan(value) else value
+
+    def condition(self, ts: float) -> str | None:
+        """Return the condition of the period a unix time falls in."""
+        if (index := self._index(ts)) is None:
+            return None
+        return self.columns.condition(index)
+
+    def code(self, ts: float) -> str | None:
+        """Return the weather code of the period a unix time falls in."""
+        if (index := self._index(ts)) is None:
+            return None
+        return self.columns.code(index)
@@ -0,0 +1,131 @@
+"""On-demand profiling of coordinator refresh and entity render cycles."""
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+from pathlib import Path
+
+from homeassistant.exceptions import HomeAssistantError
+
+from . import weather
+from .api import async_release_client
+from .const import DOMAIN
+from .coordinator import XweatherlyDataCoordinator
+from .replay import (
+    FixtureClient,
+    FixtureReplay,
+    ScratchEntry,
+    async_create_entities,
+    load_fixtures,
+)
+
+
+def _load_fixtures(path: Path) -> dict:
+    """Load every recorded response in a fixture directory."""
+    if not path.is_dir():
+        raise HomeAssistantError(f"Fixture directory {path} does not exist")
+    return load_fixtures(path)
+
+
+def _hot_spots(profile: cProfile.Profile, sort: str, top: int) -> list[dict]:
+    """Return the top functions of a profile as plain dicts."""
+    stats = pstats.Stats(profile).sort_stats(sort)
+    spots = []
+    for func in stats.fcn_list[:top]:
+        primitive_calls, calls, total, cumulative, _ = stats.stats[func]
+        filename, line, name = func
+        spots.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "total_seconds": round(total, 6),
+                "cumulative_seconds": round(cumulative, 6),
+            }
+        )
+    return spots
+
+
+async def _async_render(entities) -> None:
+    """Compute every entity's state and build both forecasts from scratch."""
+    for entity in entities:
+        entity._state_fingerprint()
+        if isinstance(entity, weather.XweatherlyWeather):
+            entity._forecast_cache.clear()
+            await entity.async_forecast_hourly()
+            await entity.async_forecast_daily()
+
+
+async def async_profile(
+    hass,
+    entry,
+    cycles: int = 1,
+    fixture: str | None = None,
+    output: str | None = None,
+    sort: str = "cumulative",
+    top: int = 25,
+) -> dict:
+    """Profile `cycles` refresh and render cycles of an entry.
+
+    Live cycles force a full refresh of the entry's coordinator, so each
+    makes real, billed API calls. With `fixture`, a scratch coordinator for
+    the same configuration replays recorded responses instead, requesting
+    every field as on a cold start, and the live coordinator is not
+    touched. Every cycle refreshes, lets the coordinator notify its
+    entities, then computes every entity's state and both forecasts on
+    fresh, unregistered entities.
+
+    The profiler sees everything the event loop runs while a cycle is in
+    progress, including other integrations' callbacks, but not the JSON
+    decodes handed to the executor.
+    """
+    for path in (fixture, output):
+        if path is not None and not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+
+    scratch = None
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if fixture is not None:
+        fixtures = await hass.async_add_executor_job(_load_fixtures, Path(fixture))
+        # Own entry id, so the stored payload and budget stay the real entry's
+        scratch = ScratchEntry(
+            f"{entry.entry_id}_profile", dict(entry.data), entry.options, entry.title
+        )
+        coordinator = XweatherlyDataCoordinator(hass, scratch)
+        async_release_client(hass, coordinator.client, scratch.entry_id)
+        coordinator.client = FixtureClient(FixtureReplay(fixtures))
+        hass.data[DOMAIN][scratch.entry_id] = coordinator
+
+    profile = cProfile.Profile()
+    elapsed = 0.0
+    try:
+        entities = await async_create_entities(hass, scratch or entry)
+        for _ in range(cycles):
+            coordinator._force_refresh = True
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                await coordinator.async_refresh()
+                await _async_render(entities)
+            finally:
+                profile.disable()
+                elapsed += time.perf_counter() - start
+    finally:
+        if scratch is not None:
+            hass.data[DOMAIN].pop(scratch.entry_id, None)
+            await coordinator.async_shutdown()
+            scratch.unload()
+            # Also cancels the scratch coordinator's pending delayed save
+            await coordinator._store.async_remove()
+
+    if output is not None:
+        await hass.async_add_executor_job(profile.dump_stats, output)
+    return {
+        "mode": "live" if scratch is None else "fixture",
+        "cycles": cycles,
+        "elapsed_seconds": round(elapsed, 3),
+        "refresh_succeeded": coordinator.last_update_success,
+        "hot_spots": _hot_spots(profile, sort, top),
+        "pstats": output,
+    }
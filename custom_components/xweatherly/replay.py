@@ -0,0 +1,168 @@
+"""Recorded Xweather responses replayed for the benchmarks and the profiler.
+
+Holds the one copy of the fixture replay, the stand-in config entry and the
+entity factory that benchmarks/ and the `xweatherly.profile` action share.
+"""
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import air_quality, button, sensor, weather
+from .api import XweatherlyNoData, _payload
+
+PLATFORM_MODULES = (weather, sensor, air_quality, button)
+
+
+def load_fixtures(path: Path) -> dict[str, dict]:
+    """Load the recorded responses in a directory, keyed by fixture name."""
+    return {file.stem: json.loads(file.read_text()) for file in path.glob("*.json")}
+
+
+def rebase_periods(fixture: dict, start: int) -> None:
+    """Shift a recorded forecast so its first period starts at `start`.
+
+    Keeps `from` paging and the incremental hourly window meaningful
+    whenever the fixture is replayed.
+    """
+    periods = fixture["response"][0]["periods"]
+    shift = start - periods[0]["timestamp"]
+    for period in periods:
+        period["timestamp"] += shift
+        period["dateTimeISO"] = datetime.fromtimestamp(
+            period["timestamp"], timezone.utc
+        ).isoformat()
+
+
+class FixtureReplay:
+    """Answers Xweather requests with recorded responses.
+
+    Fixtures are named after their endpoint, with `forecasts_1hr`,
+    `forecasts_day` and `observations_closest` for the filtered ones.
+    Responses are trimmed to the request's `from` and `limit`, and station
+    observations are stamped as current.
+    """
+
+    def __init__(self, fixtures: dict[str, dict]) -> None:
+        self.fixtures = fixtures
+        if fixtures.get("forecasts_1hr", {}).get("response"):
+            now = int(time.time())
+            rebase_periods(fixtures["forecasts_1hr"], now - now % 3600)
+
+    def _observations(self, endpoint: str, params: dict) -> dict:
+        """Return recorded station observations, stamped as current."""
+        now = int(time.time())
+        stations = [
+            {**station, "ob": {**station["ob"], "timestamp": now}}
+            for station in self.fixtures.get("observations_closest", {}).get("response", [])
+        ]
+        if endpoint == "observations/closest":
+            return {"success": True, "error": None, "response": stations[: int(params.get("limit", 10))]}
+        for station in stations:
+            if station["id"] == params.get("p"):
+                return {"success": True, "error": None, "response": station}
+        return {
+            "success": False,
+            "error": {"code": "invalid_location", "description": "Unknown station"},
+            "response": [],
+        }
+
+    def response(self, endpoint: str, params=None) -> dict:
+        """Return the recorded response body for a request."""
+        params = params or {}
+        if endpoint.startswith("observations"):
+            return self._observations(endpoint, params)
+        if endpoint == "forecasts":
+            name = "forecasts_day" if params.get("filter") == "day" else "forecasts_1hr"
+        else:
+            name = endpoint
+        recorded = self.fixtures.get(name)
+        if recorded is None:
+            return {
+                "success": False,
+                "error": {"code": "invalid_location", "description": f"No fixture for {name}"},
+                "response": [],
+            }
+        body = recorded["response"][0]
+        if "from" in params and "periods" in body:
+            start = int(params["from"])
+            body = {**body, "periods": [p for p in body["periods"] if p["timestamp"] >= start]}
+        if "limit" in params and "periods" in body:
+            body = {**body, "periods": body["periods"][: int(params["limit"])]}
+        return {"success": True, "error": None, "response": [body]}
+
+
+class FixtureClient:
+    """API client stand-in answering from a FixtureReplay, in process.
+
+    Responses go through the same checks as real ones; nothing is billed
+    and nothing is cached.
+    """
+
+    def __init__(self, replay: FixtureReplay) -> None:
+        self.replay = replay
+        self.stats = {}
+        # Never shared, so async_release_client has nothing to drop
+        self.key = None
+        self.entry_ids = set()
+
+    async def async_fetch(self, endpoint: str, extra_params=None, max_age=None, on_billed=None):
+        """Return the replayed payload for a request."""
+        return _payload(endpoint, self.replay.response(endpoint, extra_params))
+
+    async def async_fetch_batch(self, requests, max_age=None, on_billed=None):
+        """Return the replayed payload, or the error, for every request."""
+        results = []
+        for endpoint, extra_params in requests:
+            try:
+                results.append(await self.async_fetch(endpoint, extra_params))
+            except XweatherlyNoData as err:
+                results.append(err)
+        return results
+
+    async def async_fetch_list(self, endpoint: str, extra_params=None, on_billed=None):
+        """Return every replayed result for a request."""
+        data = self.replay.response(endpoint, extra_params)
+        if not data.get("success", True):
+            raise XweatherlyNoData(f"{endpoint} failed: {data['error']['description']}")
+        response = data.get("response") or []
+        return response if isinstance(response, list) else [response]
+
+
+class ScratchEntry:
+    """Just enough of a ConfigEntry for a coordinator and the platforms.
+
+    Give it an entry id of its own, so its stored payload and call budget
+    never touch a real entry's.
+    """
+
+    def __init__(self, entry_id: str, data: dict, options=None, title=None) -> None:
+        self.entry_id = entry_id
+        self.data = data
+        self.options = dict(options or {})
+        self.title = title or data.get("name", entry_id)
+        self._on_unload = []
+
+    def async_on_unload(self, func) -> None:
+        self._on_unload.append(func)
+
+    def async_create_background_task(self, hass, target, name, eager_start=True):
+        return hass.async_create_background_task(target, name)
+
+    def unload(self) -> None:
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+async def async_create_entities(hass, entry) -> list:
+    """Create every entity the platforms set up for an entry, unregistered."""
+    entities = []
+    for module in PLATFORM_MODULES:
+        await module.async_setup_entry(
+            hass, entry, lambda new, update=False: entities.extend(new)
+        )
+    for entity in entities:
+        entity.hass = hass
+    return entities
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfTemperature,
@@ -9,22 +11,45 @@ from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     UnitOfSpeed,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
-from .const import DOMAIN, DEFAULT_NAME
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    ENDPOINTS,
+    NOWCAST_INTERVAL,
+    TIER_DIAGNOSTIC,
+    TIER_ESSENTIAL,
+    TIER_EXTENDED,
+    normalize_pollutant_key,
+)
+from .entity import XweatherlyEntity
+from .derived import DERIVED_INPUTS
+from .snapshot import CONDITION_FIELDS
 
+# (conditions key, snapshot attribute, name, metric unit, tier)
 SENSORS = [
-    ("tempC", "Temperature", UnitOfTemperature.CELSIUS),
-    ("feelslikeC", "Feels Like", UnitOfTemperature.CELSIUS),
-    ("dewpointC", "Dewpoint", UnitOfTemperature.CELSIUS),
-    ("humidity", "Humidity", PERCENTAGE),
-    ("pressureMB", "Pressure", UnitOfPressure.HPA),
-    ("windSpeedMPS", "Wind Speed", UnitOfSpeed.METERS_PER_SECOND),
-    ("windGustMPS", "Wind Gust Speed", UnitOfSpeed.METERS_PER_SECOND),
-    ("windDirDEG", "Wind Direction", "°"),
-    ("uvi", "UV Index", None),
-    ("visibilityKM", "Visibility", "km"),
-    ("precipMM", "Precipitation", "mm"),
-    ("solradWM2", "Solar Radiation", "W/m²"),
+    ("tempC", "temperature", "Temperature", UnitOfTemperature.CELSIUS, TIER_ESSENTIAL),
+    ("feelslikeC", "feels_like", "Feels Like", UnitOfTemperature.CELSIUS, TIER_ESSENTIAL),
+    ("dewpointC", "dew_point", "Dewpoint", UnitOfTemperature.CELSIUS, TIER_EXTENDED),
+    ("humidity", "humidity", "Humidity", PERCENTAGE, TIER_ESSENTIAL),
+    ("pressureMB", "pressure", "Pressure", UnitOfPressure.HPA, TIER_ESSENTIAL),
+    ("windSpeedMPS", "wind_speed", "Wind Speed", UnitOfSpeed.METERS_PER_SECOND, TIER_ESSENTIAL),
+    ("windGustMPS", "wind_gust_speed", "Wind Gust Speed", UnitOfSpeed.METERS_PER_SECOND, TIER_EXTENDED),
+    ("windDirDEG", "wind_bearing", "Wind Direction", "°", TIER_EXTENDED),
+    ("uvi", "uv_index", "UV Index", None, TIER_EXTENDED),
+    ("visibilityKM", "visibility", "Visibility", "km", TIER_EXTENDED),
+    ("precipMM", "precipitation", "Precipitation", "mm", TIER_ESSENTIAL),
+    ("solradWM2", "solar_radiation", "Solar Radiation", "W/m²", TIER_EXTENDED),
+    # Derived locally from temperature, humidity and wind
+    ("heat_index", "heat_index", "Heat Index", UnitOfTemperature.CELSIUS, TIER_EXTENDED),
+    ("wind_chill", "wind_chill", "Wind Chill", UnitOfTemperature.CELSIUS, TIER_EXTENDED),
+    ("wet_bulb", "wet_bulb", "Wet Bulb Temperature", UnitOfTemperature.CELSIUS, TIER_EXTENDED),
+    ("apparent_temperature", "apparent_temperature", "Apparent Temperature", UnitOfTemperature.CELSIUS, TIER_EXTENDED),
+    ("absolute_humidity", "absolute_humidity", "Absolute Humidity", "g/m³", TIER_EXTENDED),
+    ("vapor_pressure_deficit", "vapor_pressure_deficit", "Vapor Pressure Deficit", UnitOfPressure.KPA, TIER_EXTENDED),
 ]
 
 POLLUTANTS = {
@@ -36,6 +61,166 @@ POLLUTANTS = {
     "so2": "SO2",
 }
 
+# Daily forecast fields exposed as sensors:
+# (name, metric key, imperial key, metric unit, imperial unit, tier)
+FORECAST_FIELDS = [
+    ("Predicted High Temperature", "maxTempC", "maxTempF", UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT, TIER_ESSENTIAL),
+    ("Predicted Low Temperature", "minTempC", "minTempF", UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT, TIER_ESSENTIAL),
+    ("Predicted Rain Amount", "precipMM", "precipIN", "mm", "in", TIER_EXTENDED),
+    ("Rain Probability", "pop", "pop", PERCENTAGE, PERCENTAGE, TIER_ESSENTIAL),
+    ("Predicted Wind Speed", "windSpeedKPH", "windSpeedMPH", UnitOfSpeed.KILOMETERS_PER_HOUR, UnitOfSpeed.MILES_PER_HOUR, TIER_EXTENDED),
+    ("Predicted Humidity", "humidity", "humidity", PERCENTAGE, PERCENTAGE, TIER_EXTENDED),
+    ("Predicted Average Temperature", "avgTempC", "avgTempF", UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT, TIER_EXTENDED),
+    ("Predicted Snowfall", "snowCM", "snowIN", "cm", "in", TIER_EXTENDED),
+    ("Predicted Cloud Cover", "sky", "sky", PERCENTAGE, PERCENTAGE, TIER_EXTENDED),
+]
+
+# Forecast days covered by sensors; essential fields stay essential only for
+# the first FORECAST_DAYS_ESSENTIAL of them
+FORECAST_DAYS = ENDPOINTS["forecast_daily"][1]["limit"]
+FORECAST_DAYS_ESSENTIAL = 2
+
+
+@dataclass(frozen=True, kw_only=True)
+class XweatherlyForecastSensorDescription(SensorEntityDescription):
+    """Describes a daily forecast field for one day offset."""
+
+    key_metric: str
+    key_imperial: str
+    unit_metric: str | None
+    unit_imperial: str | None
+    day_offset: int
+    tier: str
+
+
+def _day_label(day_offset: int) -> str:
+    if day_offset == 0:
+        return "Today"
+    if day_offset == 1:
+        return "Tomorrow"
+    return f"In {day_offset} Days"
+
+
+FORECAST_SENSORS = [
+    XweatherlyForecastSensorDescription(
+        key=f"{key_metric}_day{day_offset}",
+        name=f"{name} {_day_label(day_offset)}",
+        key_metric=key_metric,
+        key_imperial=key_imperial,
+        unit_metric=unit_metric,
+        unit_imperial=unit_imperial,
+        day_offset=day_offset,
+        tier=tier if day_offset < FORECAST_DAYS_ESSENTIAL else TIER_EXTENDED,
+    )
+    for day_offset in range(FORECAST_DAYS)
+    for name, key_metric, key_imperial, unit_metric, unit_imperial, tier in FORECAST_FIELDS
+]
+
+
+@dataclass(frozen=True, kw_only=True)
+class XweatherlyTrendSensorDescription(SensorEntityDescription):
+    """Describes a trend computed from the conditions history."""
+
+    key_metric: str
+    key_imperial: str
+    unit_metric: str | None
+    unit_imperial: str | None
+    # ConditionsHistory method computing the trend: change, rate or maximum
+    trend: str
+    hours: int
+
+
+TREND_SENSORS = [
+    XweatherlyTrendSensorDescription(
+        key="pressure_tendency_3h",
+        name="Pressure Tendency 3h",
+        icon="mdi:gauge",
+        key_metric="pressureMB",
+        key_imperial="pressureIN",
+        unit_metric=UnitOfPressure.HPA,
+        unit_imperial=UnitOfPressure.INHG,
+        trend="change",
+        hours=3,
+    ),
+    XweatherlyTrendSensorDescription(
+        key="temperature_rate_1h",
+        name="Temperature Change per Hour",
+        icon="mdi:thermometer-lines",
+        key_metric="tempC",
+        key_imperial="tempF",
+        unit_metric=f"{UnitOfTemperature.CELSIUS}/h",
+        unit_imperial=f"{UnitOfTemperature.FAHRENHEIT}/h",
+        trend="rate",
+        hours=1,
+    ),
+    XweatherlyTrendSensorDescription(
+        key="wind_gust_max_3h",
+        name="Wind Gust Max 3h",
+        icon="mdi:weather-windy",
+        key_metric="windGustMPS",
+        key_imperial="windGustMPH",
+        unit_metric=UnitOfSpeed.METERS_PER_SECOND,
+        unit_imperial=UnitOfSpeed.MILES_PER_HOUR,
+        trend="maximum",
+        hours=3,
+    ),
+]
+
+
+@dataclass(frozen=True, kw_only=True)
+class XweatherlyNowcastSensorDescription(SensorEntityDescription):
+    """Describes an hourly forecast field interpolated to the current minute.
+
+    Without keys the sensor reports the stepped condition instead.
+    """
+
+    key_metric: str | None = None
+    key_imperial: str | None = None
+    unit_metric: str | None = None
+    unit_imperial: str | None = None
+
+
+NOWCAST_SENSORS = [
+    XweatherlyNowcastSensorDescription(
+        key="nowcast_temperature",
+        name="Nowcast Temperature",
+        key_metric="tempC",
+        key_imperial="tempF",
+        unit_metric=UnitOfTemperature.CELSIUS,
+        unit_imperial=UnitOfTemperature.FAHRENHEIT,
+    ),
+    XweatherlyNowcastSensorDescription(
+        key="nowcast_dew_point",
+        name="Nowcast Dew Point",
+        key_metric="dewpointC",
+        key_imperial="dewpointF",
+        unit_metric=UnitOfTemperature.CELSIUS,
+        unit_imperial=UnitOfTemperature.FAHRENHEIT,
+    ),
+    XweatherlyNowcastSensorDescription(
+        key="nowcast_wind_speed",
+        name="Nowcast Wind Speed",
+        key_metric="windSpeedMPS",
+        key_imperial="windSpeedMPH",
+        unit_metric=UnitOfSpeed.METERS_PER_SECOND,
+        unit_imperial=UnitOfSpeed.MILES_PER_HOUR,
+    ),
+    XweatherlyNowcastSensorDescription(
+        key="nowcast_pressure",
+        name="Nowcast Pressure",
+        key_metric="pressureMB",
+        key_imperial="pressureIN",
+        unit_metric=UnitOfPressure.HPA,
+        unit_imperial=UnitOfPressure.INHG,
+    ),
+    XweatherlyNowcastSensorDescription(
+        key="nowcast_condition",
+        name="Nowcast Condition",
+        icon="mdi:weather-partly-cloudy",
+    ),
+]
+
+
 def _alt_unit(unit):
     return (
         UnitOfTemperature.FAHRENHEIT if unit == UnitOfTemperature.CELSIUS else
@@ -46,30 +231,23 @@ def _alt_unit(unit):
         unit
     )
 
-def _imperial_key(key):
-    return (
-        key.replace("C", "F")
-        if "C" in key else key.replace("MPS", "MPH")
-        if "MPS" in key else key.replace("KM", "MI")
-        if "KM" in key else key.replace("MM", "IN")
-        if "MM" in key else key
-    )
-
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
 
-    for key, name, unit in SENSORS:
+    for key, field, name, unit, tier in SENSORS:
         entities.append(
             XweatherlySensor(
                 coordinator,
                 entry,
                 key,
+                field,
                 name,
                 unit,
                 source="conditions",
                 key_override=key,
+                tier=tier,
             )
         )
 
@@ -87,230 +265,29 @@ async def async_setup_entry(hass, entry, async_add_entities):
         )
 
     entities.append(XweatherlyAqiSensor(coordinator, entry))
-
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted High Temperature Today",
-            key_metric="maxTempC",
-            key_imperial="maxTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Low Temperature Today",
-            key_metric="minTempC",
-            key_imperial="minTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Rain Amount Today",
-            key_metric="precipMM",
-            key_imperial="precipIN",
-            unit_metric="mm",
-            unit_imperial="in",
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Rain Probability Today",
-            key_metric="pop",  
-            key_imperial="pop",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Wind Speed Today",
-            key_metric="windSpeedKPH",
-            key_imperial="windSpeedMPH",
-            unit_metric=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            unit_imperial=UnitOfSpeed.MILES_PER_HOUR,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Humidity Today",
-            key_metric="humidity", 
-            key_imperial="humidity",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Average Temperature Today",
-            key_metric="avgTempC",
-            key_imperial="avgTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Snowfall Today",
-            key_metric="snowCM",
-            key_imperial="snowIN",
-            unit_metric="cm",
-            unit_imperial="in",
-            day_offset=0,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Cloud Cover Today",
-            key_metric="sky",
-            key_imperial="sky",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=0,
-        )
-    )
-
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted High Temperature Tomorrow",
-            key_metric="maxTempC",
-            key_imperial="maxTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Low Temperature Tomorrow",
-            key_metric="minTempC",
-            key_imperial="minTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Rain Amount Tomorrow",
-            key_metric="precipMM",
-            key_imperial="precipIN",
-            unit_metric="mm",
-            unit_imperial="in",
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Rain Probability Tomorrow",
-            key_metric="pop",
-            key_imperial="pop",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Wind Speed Tomorrow",
-            key_metric="windSpeedKPH",
-            key_imperial="windSpeedMPH",
-            unit_metric=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            unit_imperial=UnitOfSpeed.MILES_PER_HOUR,
-            day_offset=1,
-        )
+    entities.append(XweatherlyApiUsageSensor(coordinator, entry))
+    entities.append(XweatherlyApiProjectionSensor(coordinator, entry))
+    entities.append(XweatherlyVolatilitySensor(coordinator, entry))
+    entities.append(XweatherlyRefreshDurationSensor(coordinator, entry))
+    entities.append(XweatherlyStateWritesSensor(coordinator, entry))
+
+    entities.extend(
+        XweatherlyForecastSensor(coordinator, entry, description)
+        for description in FORECAST_SENSORS
     )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Humidity Tomorrow",
-            key_metric="humidity",
-            key_imperial="humidity",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=1,
-        )
+    entities.extend(
+        XweatherlyTrendSensor(coordinator, entry, description)
+        for description in TREND_SENSORS
     )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Average Temperature Tomorrow",
-            key_metric="avgTempC",
-            key_imperial="avgTempF",
-            unit_metric=UnitOfTemperature.CELSIUS,
-            unit_imperial=UnitOfTemperature.FAHRENHEIT,
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Snowfall Tomorrow",
-            key_metric="snowCM",
-            key_imperial="snowIN",
-            unit_metric="cm",
-            unit_imperial="in",
-            day_offset=1,
-        )
-    )
-    entities.append(
-        XweatherlyForecastSensor(
-            coordinator,
-            entry,
-            name="Predicted Cloud Cover Tomorrow",
-            key_metric="sky",
-            key_imperial="sky",
-            unit_metric=PERCENTAGE,
-            unit_imperial=PERCENTAGE,
-            day_offset=1,
-        )
+    entities.extend(
+        XweatherlyNowcastSensor(coordinator, entry, description)
+        for description in NOWCAST_SENSORS
     )
 
+    async_add_entities(entities)
 
-    async_add_entities(entities, True)
 
-
-class XweatherlyBaseSensor(CoordinatorEntity, SensorEntity):
+class XweatherlyBaseSensor(XweatherlyEntity, SensorEntity):
     """Base class for Xweatherly sensors with device info."""
 
     def __init__(self, coordinator, entry):
@@ -328,97 +305,69 @@ class XweatherlyBaseSensor(CoordinatorEntity, SensorEntity):
         }
 
 class XweatherlySensor(XweatherlyBaseSensor):
-    """Standard weather sensor with dynamic unit selection."""
+    """Current conditions sensor reading from the coordinator snapshot."""
 
-    def __init__(self, coordinator, entry, key, name, unit, source, key_override=None):
+    def __init__(
+        self, coordinator, entry, key, field, name, unit, source, key_override=None, tier=TIER_ESSENTIAL
+    ):
         super().__init__(coordinator, entry)
+        self._tier = tier
         self.key = key
+        self.field = field
         self.key_override = key_override or key
         self.source = source
+        self._sources = (source,)
+        self._fields = {source: CONDITION_FIELDS.get(field, DERIVED_INPUTS)}
         self.name_field = name
         self._unit_metric = unit
         self._unit_imperial = _alt_unit(unit)
         self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} {name}"
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{self.key_override}"
 
-    def _sel(self, metric, imperial):
-        unit = self.coordinator.hass.config.units.temperature_unit
-        is_metric = unit == UnitOfTemperature.CELSIUS
-        return metric if is_metric else imperial
-
     @property
     def available(self):
-        data = self.coordinator.data.get(self.source, {})
-        periods = data.get("periods", [])
-        if not periods:
-            return False
-        metric_val = periods[0].get(self.key)
-        imperial_val = periods[0].get(_imperial_key(self.key))
-        return (metric_val is not None or imperial_val is not None)
+        snapshot = self.coordinator.snapshot
+        return snapshot is not None and getattr(snapshot, self.field) is not None
 
     @property
     def native_value(self):
-        data = self.coordinator.data.get(self.source, {})
-        periods = data.get("periods", [{}])
-        period = periods[0] if periods else {}
-        metric_val = period.get(self.key)
-        imperial_val = period.get(_imperial_key(self.key))
-        return self._sel(metric_val, imperial_val)
+        snapshot = self.coordinator.snapshot
+        return getattr(snapshot, self.field) if snapshot is not None else None
 
     @property
     def native_unit_of_measurement(self):
-        return self._sel(self._unit_metric, self._unit_imperial)
+        return self._unit_metric if self.coordinator.is_metric else self._unit_imperial
 
 class XweatherlyPollutantSensor(XweatherlyBaseSensor):
     """Pollutant sensor for Xweatherly."""
 
+    _sources = ("airquality",)
+    _fields = {"airquality": ("pollutants",)}
+    _tier = TIER_EXTENDED
+
     def __init__(self, coordinator, entry, pollutant_key, name, unit, key_override=None):
         super().__init__(coordinator, entry)
         self.pollutant_key = pollutant_key
+        self._safe_type = normalize_pollutant_key(pollutant_key)
         self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} {name}"
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{key_override or pollutant_key}"
         self._attr_native_unit_of_measurement = unit
 
     @property
     def available(self):
-        aq = self.coordinator.data.get("airquality", {})
-        periods = aq.get("periods", [])
-        if not periods:
-            return False
-        for pol in periods[0].get("pollutants", []):
-            pol_key = pol.get("type") or pol.get("name", "").lower()
-            if not pol_key:
-                continue
-            norm = pol_key.replace(".", "").replace(" ", "").lower()
-            match = self.pollutant_key.replace(".", "").lower()
-            if norm == match and (pol.get("valueUGM3") or pol.get("concentrationUGM3") or pol.get("value")) is not None:
-                return True
-        return False
+        return self.coordinator.pollutants.get(self._safe_type) is not None
 
     @property
     def native_value(self):
-        aq = self.coordinator.data.get("airquality", {})
-        periods = aq.get("periods", [{}])
-        if not periods:
-            return None
-        for pol in periods[0].get("pollutants", []):
-            key = pol.get("type") or pol.get("name", "").lower()
-            if not key:
-                continue
-            norm = key.replace(".", "").replace(" ", "").lower()
-            match = self.pollutant_key.replace(".", "").lower()
-            if norm == match:
-                return (
-                    pol.get("valueUGM3")
-                    or pol.get("concentrationUGM3")
-                    or pol.get("value")
-                )
-        return None
+        return self.coordinator.pollutants.get(self._safe_type)
 
 class XweatherlyAqiSensor(XweatherlyBaseSensor):
     """AQI sensor for Xweatherly."""
 
     _attr_native_unit_of_measurement = None
+    _sources = ("airquality",)
+    _fields = {"airquality": ("aqi",)}
+    _tier = TIER_EXTENDED
 
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
@@ -444,33 +393,32 @@ class XweatherlyAqiSensor(XweatherlyBaseSensor):
 class XweatherlyForecastSensor(XweatherlyBaseSensor):
     """Forecast sensor for Xweatherly with dynamic unit selection."""
 
-    def __init__(self, coordinator, entry, name, key_metric, key_imperial, unit_metric, unit_imperial, day_offset):
+    entity_description: XweatherlyForecastSensorDescription
+    _sources = ("forecast_daily",)
+
+    def __init__(self, coordinator, entry, description):
         super().__init__(coordinator, entry)
-        self.key_metric = key_metric
-        self.key_imperial = key_imperial
-        self.day_offset = day_offset
+        self.entity_description = description
+        self._tier = description.tier
+        self.key_metric = description.key_metric
+        self.key_imperial = description.key_imperial
+        self.day_offset = description.day_offset
+        self._fields = {"forecast_daily": (self.key_metric, self.key_imperial)}
 
-        self._unit_metric = unit_metric
-        self._unit_imperial = unit_imperial
+        self._unit_metric = description.unit_metric
+        self._unit_imperial = description.unit_imperial
 
+        name = description.name
         self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} {name}"
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{name.replace(' ', '_').lower()}"
 
     def _sel(self, metric, imperial):
-        unit = self.coordinator.hass.config.units.temperature_unit
-        is_metric = unit == UnitOfTemperature.CELSIUS
-        return metric if is_metric else imperial
+        return metric if self.coordinator.is_metric else imperial
 
     @property
     def native_value(self):
-        forecast_data = self.coordinator.data.get("forecast_daily", {})
-        periods = forecast_data.get("periods", [])
-        if len(periods) > self.day_offset:
-            period = periods[self.day_offset]
-            metric_val = period.get(self.key_metric)
-            imperial_val = period.get(self.key_imperial)
-            return self._sel(metric_val, imperial_val)
-        return None
+        columns = self.coordinator.data["forecast_daily"]
+        return columns.value(self._sel(self.key_metric, self.key_imperial), self.day_offset)
 
     @property
     def native_unit_of_measurement(self):
@@ -478,9 +426,251 @@ class XweatherlyForecastSensor(XweatherlyBaseSensor):
 
     @property
     def available(self):
-        forecast_data = self.coordinator.data.get("forecast_daily", {})
-        periods = forecast_data.get("periods", [])
-        if len(periods) > self.day_offset:
-            period = periods[self.day_offset]
-            return period.get(self.key_metric) is not None or period.get(self.key_imperial) is not None
-        return False
+        columns = self.coordinator.data["forecast_daily"]
+        return (
+            columns.value(self.key_metric, self.day_offset) is not None
+            or columns.value(self.key_imperial, self.day_offset) is not None
+        )
+
+
+class XweatherlyTrendSensor(XweatherlyBaseSensor):
+    """Trend over recent conditions, read from the coordinator's history."""
+
+    entity_description: XweatherlyTrendSensorDescription
+    _sources = ("conditions",)
+    _tier = TIER_EXTENDED
+
+    def __init__(self, coordinator, entry, description):
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._fields = {"conditions": (description.key_metric, description.key_imperial)}
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} {description.name}"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+
+    @property
+    def available(self):
+        return self.native_value is not None
+
+    @property
+    def native_value(self):
+        description = self.entity_description
+        key = description.key_metric if self.coordinator.is_metric else description.key_imperial
+        value = getattr(self.coordinator.history, description.trend)(key, description.hours)
+        return None if value is None else round(value, 2)
+
+    @property
+    def native_unit_of_measurement(self):
+        description = self.entity_description
+        return description.unit_metric if self.coordinator.is_metric else description.unit_imperial
+
+
+class XweatherlyNowcastSensor(XweatherlyBaseSensor):
+    """Hourly forecast interpolated to the current minute.
+
+    Updates every NOWCAST_INTERVAL seconds from the coordinator's nowcast
+    engine, without fetching anything, and writes state only when the
+    rounded value changes.
+    """
+
+    entity_description: XweatherlyNowcastSensorDescription
+    _sources = ("forecast_hourly",)
+    _tier = TIER_EXTENDED
+
+    def __init__(self, coordinator, entry, description):
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        keys = (description.key_metric, description.key_imperial)
+        if not description.key_metric:
+            keys = ("weatherPrimaryCoded", "isDay")
+        self._fields = {"forecast_hourly": keys}
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} {description.name}"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=NOWCAST_INTERVAL)
+            )
+        )
+
+    @callback
+    def _async_tick(self, now) -> None:
+        """Re-evaluate the nowcast and write state if it moved."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint != self._last_fingerprint:
+            self._last_fingerprint = fingerprint
+            self.async_write_ha_state()
+
+    @property
+    def available(self):
+        return self.native_value is not None
+
+    @property
+    def native_value(self):
+        description = self.entity_description
+        nowcast = self.coordinator.nowcast
+        now = dt_util.utcnow().timestamp()
+        if not description.key_metric:
+            return nowcast.condition(now)
+        key = description.key_metric if self.coordinator.is_metric else description.key_imperial
+        value = nowcast.value(key, now)
+        return None if value is None else round(value, 1)
+
+    @property
+    def native_unit_of_measurement(self):
+        description = self.entity_description
+        return description.unit_metric if self.coordinator.is_metric else description.unit_imperial
+
+
+class XweatherlyApiUsageSensor(XweatherlyBaseSensor):
+    """Billed Xweather API calls used in the current budget period."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:counter"
+    _attr_native_unit_of_measurement = "calls"
+    _sources = ("budget",)
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} API Calls Used"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_api_calls_used"
+        # Worth showing by default once the user has set an allowance
+        self._tier = TIER_ESSENTIAL if coordinator.budget.allowance else TIER_DIAGNOSTIC
+
+    @property
+    def available(self):
+        return True
+
+    @property
+    def native_value(self):
+        return self.coordinator.budget.used
+
+    @property
+    def extra_state_attributes(self):
+        budget = self.coordinator.budget
+        return {
+            **(super().extra_state_attributes or {}),
+            "allowance": budget.allowance or None,
+            "period": budget.period,
+            "period_start": budget.period_start.isoformat(),
+            "usage_by_endpoint": dict(budget.usage),
+            "update_intervals": {
+                key: int(interval.total_seconds() // 60)
+                for key, interval in self.coordinator.active_intervals().items()
+            },
+        }
+
+
+class XweatherlyApiProjectionSensor(XweatherlyBaseSensor):
+    """Billed Xweather API calls projected by the end of the budget period."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:chart-line"
+    _attr_native_unit_of_measurement = "calls"
+    _sources = ("budget",)
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} API Calls Projected"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_api_calls_projected"
+        self._tier = TIER_ESSENTIAL if coordinator.budget.allowance else TIER_DIAGNOSTIC
+
+    @property
+    def available(self):
+        return True
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.budget.projected(self.coordinator.active_intervals()))
+
+
+class XweatherlyVolatilitySensor(XweatherlyBaseSensor):
+    """Weather volatility score steering the adaptive conditions interval."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:weather-lightning-rainy"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _sources = ("volatility", "budget")
+    _tier = TIER_DIAGNOSTIC
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} Weather Volatility"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_weather_volatility"
+
+    @property
+    def available(self):
+        return self.coordinator.volatility_score is not None
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.volatility_score * 100)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            **(super().extra_state_attributes or {}),
+            "signals": {
+                name: round(value * 100) for name, value in self.coordinator.volatility.items()
+            },
+            "conditions_interval": int(
+                self.coordinator.endpoint_intervals["conditions"].total_seconds() // 60
+            ),
+        }
+
+
+class XweatherlyRefreshDurationSensor(XweatherlyBaseSensor):
+    """Wall time of the latest coordinator refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-outline"
+    _attr_native_unit_of_measurement = "ms"
+    _sources = ("stats",)
+    _tier = TIER_DIAGNOSTIC
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} Refresh Duration"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_refresh_duration"
+
+    @property
+    def available(self):
+        return self.coordinator.refresh_stats.refreshes > 0
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.refresh_stats.last_seconds * 1000, 1)
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.coordinator.refresh_stats
+        return {
+            **(super().extra_state_attributes or {}),
+            "refreshes": stats.refreshes,
+            "failures": stats.failures,
+            "max_ms": round(stats.max_seconds * 1000, 1),
+        }
+
+
+class XweatherlyStateWritesSensor(XweatherlyBaseSensor):
+    """Entity state writes caused by the previous coordinator refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:pencil-outline"
+    _attr_native_unit_of_measurement = "writes"
+    _sources = ("stats",)
+    _tier = TIER_DIAGNOSTIC
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data.get('name', DEFAULT_NAME)} State Writes per Refresh"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_state_writes"
+
+    @property
+    def available(self):
+        return self.coordinator.refresh_stats.refreshes > 0
+
+    @property
+    def native_value(self):
+        return self.coordinator.refresh_stats.last_state_writes
@@ -0,0 +1,80 @@
+"""Unit-resolved snapshot of the current Xweather conditions."""
+from __future__ import annotations
+
+from homeassistant.const import UnitOfPressure, UnitOfSpeed, UnitOfTemperature
+
+from .const import ICON_MAP
+from .derived import DERIVED_FIELDS, derive_period
+
+# Snapshot attribute -> (metric key, imperial key) in a conditions period
+CONDITION_FIELDS = {
+    "temperature": ("tempC", "tempF"),
+    "feels_like": ("feelslikeC", "feelslikeF"),
+    "dew_point": ("dewpointC", "dewpointF"),
+    "humidity": ("humidity", "humidity"),
+    "pressure": ("pressureMB", "pressureIN"),
+    "wind_speed": ("windSpeedMPS", "windSpeedMPH"),
+    "wind_gust_speed": ("windGustMPS", "windGustMPH"),
+    "wind_bearing": ("windDirDEG", "windDirDEG"),
+    "uv_index": ("uvi", "uvi"),
+    "visibility": ("visibilityKM", "visibilityMI"),
+    "precipitation": ("precipMM", "precipIN"),
+    "solar_radiation": ("solradWM2", "solradWM2"),
+}
+
+# Snapshot unit attribute -> (metric unit, imperial unit)
+UNIT_FIELDS = {
+    "temperature_unit": (UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT),
+    "pressure_unit": (UnitOfPressure.HPA, UnitOfPressure.INHG),
+    "speed_unit": (UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR),
+    "visibility_unit": ("km", "mi"),
+    "precipitation_unit": ("mm", "in"),
+}
+
+
+def weather_code(period) -> str | None:
+    """Return the weather part of a period's coded weather, e.g. `RW`."""
+    return (period.get("weatherPrimaryCoded") or "").split(":")[-1] or None
+
+
+def condition_from_period(period) -> str | None:
+    """Map a period's coded weather to a Home Assistant condition.
+
+    Returns None, an unknown condition, when the period is not coded.
+    """
+    if (code := weather_code(period)) is None:
+        return None
+    if not period.get("isDay", True) and code in ("SC", "CL"):
+        code = f"{code}-N"
+    return ICON_MAP.get(code, "cloudy")
+
+
+class ConditionsSnapshot:
+    """Current conditions resolved to the active unit system.
+
+    Built once per conditions update (and again when the unit system changes)
+    so entities read plain attributes instead of walking the raw payload.
+    """
+
+    __slots__ = ("is_metric", "condition", *CONDITION_FIELDS, *DERIVED_FIELDS, *UNIT_FIELDS)
+
+    def __init__(self, period, is_metric: bool) -> None:
+        """Resolve a conditions period for the given unit system."""
+        index = 0 if is_metric else 1
+        self.is_metric = is_metric
+        self.condition = condition_from_period(period)
+        for name, keys in CONDITION_FIELDS.items():
+            setattr(self, name, period.get(keys[index]))
+        derived = derive_period(period)
+        for name, keys in DERIVED_FIELDS.items():
+            setattr(self, name, derived[keys[index]])
+        for name, units in UNIT_FIELDS.items():
+            setattr(self, name, units[index])
+
+    @classmethod
+    def from_conditions(cls, conditions, is_metric: bool) -> ConditionsSnapshot | None:
+        """Build a snapshot from a conditions payload, if it has a period."""
+        periods = (conditions or {}).get("periods")
+        if not periods:
+            return None
+        return cls(periods[0], is_metric)
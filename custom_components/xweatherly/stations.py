@@ -0,0 +1,225 @@
+"""Nearest-station observation source for the conditions data key."""
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    STATION_LIST_MAX_AGE,
+    STATION_MAX_AGE,
+    STATION_MIN_QC,
+    STATION_REJECT_TIME,
+    STATION_SEARCH_LIMIT,
+    STATION_SEARCH_RADIUS,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Station:
+    """An observation station from the area's station list."""
+
+    id: str
+    lat: float
+    lon: float
+
+
+def _passes_quality(ob) -> bool:
+    """Return whether an observation passed Xweather's quality control."""
+    qc = ob.get("QCcode")
+    return ob.get("tempC") is not None and (qc is None or qc >= STATION_MIN_QC)
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+class StationIndex:
+    """2-d k-d tree of stations over a local equirectangular projection.
+
+    Longitudes are scaled by the cosine of the origin latitude, which keeps
+    distances accurate enough at the scale of a station search radius.
+    """
+
+    def __init__(self, stations, origin_lat: float) -> None:
+        self._scale = math.cos(math.radians(origin_lat))
+        points = [((station.lon * self._scale, station.lat), station) for station in stations]
+        self._root = self._build(points, 0)
+
+    def _build(self, points, axis: int):
+        """Return a (point, station, axis, left, right) node, or None."""
+        if not points:
+            return None
+        points.sort(key=lambda item: item[0][axis])
+        middle = len(points) // 2
+        point, station = points[middle]
+        return (
+            point,
+            station,
+            axis,
+            self._build(points[:middle], 1 - axis),
+            self._build(points[middle + 1 :], 1 - axis),
+        )
+
+    def nearest(self, lat: float, lon: float, accept=lambda station: True) -> Station | None:
+        """Return the nearest station `accept` allows, searching best first."""
+        target = (lon * self._scale, lat)
+        best, best_distance = None, math.inf
+        heap = [(0.0, 0, self._root)]
+        counter = 1
+        while heap:
+            bound, _, node = heapq.heappop(heap)
+            if node is None or bound >= best_distance:
+                continue
+            point, station, axis, left, right = node
+            distance = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2
+            if distance < best_distance and accept(station):
+                best, best_distance = station, distance
+            offset = target[axis] - point[axis]
+            near, far = (left, right) if offset < 0 else (right, left)
+            heapq.heappush(heap, (bound, counter, near))
+            heapq.heappush(heap, (max(bound, offset * offset), counter + 1, far))
+            counter += 2
+        return best
+
+
+class XweatherlyStations:
+    """Feeds `conditions` from the nearest good observation station.
+
+    The area's station list is fetched once (and again after
+    STATION_LIST_MAX_AGE) into a StationIndex. Each poll then requests only
+    the selected station's observation. A station whose observation is stale
+    or fails quality control is set aside for STATION_REJECT_TIME and the
+    next nearest station is picked from the index, without searching the
+    API again.
+    """
+
+    def __init__(self, lat: float, lon: float) -> None:
+        self.lat = lat
+        self.lon = lon
+        self.stations = {}
+        self.index = None
+        self.listed_at = None
+        self.station_id = None
+        # Station id -> time until which it is not selected
+        self._rejected = {}
+
+    def needs_list(self, now: datetime) -> bool:
+        """Return whether the station list has to be (re)fetched."""
+        return self.listed_at is None or now - self.listed_at >= timedelta(
+            minutes=STATION_LIST_MAX_AGE
+        )
+
+    def list_request(self):
+        """Return the (endpoint, params) request listing nearby stations."""
+        return "observations/closest", {
+            "p": f"{self.lat},{self.lon}",
+            "limit": STATION_SEARCH_LIMIT,
+            "radius": f"{STATION_SEARCH_RADIUS}km",
+            "filter": "allstations",
+        }
+
+    def request(self):
+        """Return the (endpoint, params) request for the selected station."""
+        return "observations", {"p": self.station_id}
+
+    def load_list(self, observations, now: datetime) -> None:
+        """Index the stations of a station list whose observations pass QC."""
+        self.stations = {}
+        for observation in observations or []:
+            loc = observation.get("loc") or {}
+            if (
+                observation.get("id")
+                and loc.get("lat") is not None
+                and loc.get("long") is not None
+                and _passes_quality(observation.get("ob") or {})
+            ):
+                self.stations[observation["id"]] = Station(
+                    observation["id"], loc["lat"], loc["long"]
+                )
+        self.index = StationIndex(self.stations.values(), self.lat)
+        self.listed_at = now
+
+    def select(self, now: datetime) -> str | None:
+        """Select the nearest station not currently set aside."""
+        self._rejected = {sid: until for sid, until in self._rejected.items() if until > now}
+        station = None
+        if self.index is not None:
+            station = self.index.nearest(
+                self.lat, self.lon, lambda candidate: candidate.id not in self._rejected
+            )
+        self.station_id = station.id if station else None
+        return self.station_id
+
+    def reject(self, now: datetime) -> None:
+        """Set the selected station aside and clear the selection."""
+        if self.station_id is not None:
+            self._rejected[self.station_id] = now + timedelta(minutes=STATION_REJECT_TIME)
+        self.station_id = None
+
+    @property
+    def distance(self) -> float | None:
+        """Return the selected station's distance in km."""
+        station = self.stations.get(self.station_id)
+        if station is None:
+            return None
+        return round(distance_km(self.lat, self.lon, station.lat, station.lon), 1)
+
+    @staticmethod
+    def to_conditions(observation, now: datetime, code: str | None = None):
+        """Return a station observation shaped as a conditions payload.
+
+        Personal weather stations rarely report coded weather; `code`, the
+        model's weather code for the current hour, stands in when the
+        observation has none, and without either the condition is unknown.
+        Returns None when the observation is stale or fails quality control.
+        """
+        ob = (observation or {}).get("ob") or {}
+        ts = ob.get("timestamp")
+        if (
+            ts is None
+            or now.timestamp() - ts > STATION_MAX_AGE * 60
+            or not _passes_quality(ob)
+        ):
+            return None
+        period = dict(ob)
+        if not period.get("weatherPrimaryCoded") and code is not None:
+            period["weatherPrimaryCoded"] = f"::{code}"
+        for speed in ("windSpeed", "windGust"):
+            kph = period.get(f"{speed}KPH")
+            if period.get(f"{speed}MPS") is None and kph is not None:
+                period[f"{speed}MPS"] = round(kph / 3.6, 1)
+        return {
+            "id": observation.get("id"),
+            "loc": observation.get("loc"),
+            "place": observation.get("place"),
+            "profile": observation.get("profile"),
+            "periods": [period],
+        }
+
+    def as_dict(self) -> dict:
+        """Return the station list and selection for storage."""
+        return {
+            "listed_at": self.listed_at.isoformat() if self.listed_at else None,
+            "station_id": self.station_id,
+            "stations": [[s.id, s.lat, s.lon] for s in self.stations.values()],
+        }
+
+    def load(self, stored) -> None:
+        """Restore a stored station list and selection."""
+        listed_at = dt_util.parse_datetime(stored.get("listed_at") or "")
+        if listed_at is None:
+            return
+        self.stations = {sid: Station(sid, lat, lon) for sid, lat, lon in stored.get("stations", [])}
+        self.index = StationIndex(self.stations.values(), self.lat)
+        self.listed_at = listed_at
+        if stored.get("station_id") in self.stations:
+            self.station_id = stored["station_id"]
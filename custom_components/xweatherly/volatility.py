@@ -0,0 +1,72 @@
+"""Weather volatility score steering how often conditions are polled."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from .const import (
+    SEVERE_CODES,
+    VOLATILITY_GUST,
+    VOLATILITY_HOURS,
+    VOLATILITY_POP,
+    VOLATILITY_PRESSURE,
+)
+from .forecast_columns import ForecastColumns
+from .snapshot import weather_code
+
+# Conditions payload fields the signals read
+VOLATILITY_FIELDS = ("pressureMB", "windGustMPS", "weatherPrimaryCoded")
+
+
+def _clamp(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
+
+
+def volatility_signals(
+    conditions, hourly: ForecastColumns, history, now: float
+) -> dict[str, float]:
+    """Return each volatility signal, from 0 (calm) to 1 (active weather).
+
+    Signals whose inputs are missing are left out: precipitation chance and
+    severe weather over the next VOLATILITY_HOURS of the hourly forecast,
+    the 3-hour pressure tendency and highest gust from the conditions
+    history, and severe weather in the current conditions.
+    """
+    signals = {}
+    period = ((conditions or {}).get("periods") or [{}])[0]
+
+    upcoming = [
+        index
+        for index, ts in enumerate(hourly.timestamps)
+        if now - 3600 < ts <= now + VOLATILITY_HOURS * 3600
+    ]
+    pops = [pop for index in upcoming if (pop := hourly.value("pop", index)) is not None]
+    if pops:
+        signals["precipitation"] = _clamp(max(pops) / VOLATILITY_POP)
+
+    if (tendency := history.change("pressureMB", 3)) is not None:
+        signals["pressure"] = _clamp(abs(tendency) / VOLATILITY_PRESSURE)
+
+    gust = history.maximum("windGustMPS", 3)
+    if gust is None:
+        gust = period.get("windGustMPS")
+    if gust is not None:
+        signals["gust"] = _clamp(gust / VOLATILITY_GUST)
+
+    # Raw codes, as the Home Assistant conditions they map to also cover
+    # codes that are not severe
+    severe = weather_code(period) in SEVERE_CODES or any(
+        hourly.code(index) in SEVERE_CODES for index in upcoming
+    )
+    if period or upcoming:
+        signals["severe"] = 1.0 if severe else 0.0
+    return signals
+
+
+def conditions_interval(score: float, fastest: int, slowest: int) -> timedelta:
+    """Return the conditions interval for a score, between the bounds in minutes.
+
+    Interpolates geometrically, so the interval halves in equal steps of
+    the score rather than shrinking mostly at the top of the scale.
+    """
+    fastest, slowest = sorted((fastest, slowest))
+    return timedelta(minutes=slowest * (fastest / slowest) ** _clamp(score))
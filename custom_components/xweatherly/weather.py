@@ -5,27 +5,64 @@ from homeassistant.components.weather import (
     WeatherEntityFeature,
     Forecast,
 )
-from homeassistant.const import UnitOfTemperature, UnitOfPressure, UnitOfSpeed
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, ICON_MAP, DEFAULT_NAME
+from homeassistant.core import callback
+from .const import DOMAIN, DEFAULT_NAME
+from .derived import DERIVED_FIELDS
+from .entity import XweatherlyEntity
+from .snapshot import CONDITION_FIELDS
+
+# Forecast type -> coordinator data key it is built from
+FORECAST_SOURCES = {
+    "hourly": "forecast_hourly",
+    "daily": "forecast_daily",
+}
+
+# Forecast period fields read by the forecast builders below
+HOURLY_FORECAST_FIELDS = (
+    "tempC", "tempF", "precipMM", "precipIN", "humidity", "pressureMB", "pressureIN",
+    "windSpeedMPS", "windSpeedMPH", "windDirDEG", "windGustMPS", "windGustMPH",
+    "dewpointC", "dewpointF", "pop",
+)
+DAILY_FORECAST_FIELDS = (
+    "maxTempC", "maxTempF", "tempC", "tempF", "minTempC", "minTempF", "precipMM",
+    "precipIN", "pop", "windSpeedMPS", "windSpeedMPH", "windDirDEG", "humidity",
+    "dewpointC", "dewpointF",
+)
+
+# Derived metric -> key it is added under to Forecast entries when the
+# forecast extras option is on; apparent temperature is always included
+FORECAST_EXTRA_KEYS = {
+    "heat_index": "heat_index",
+    "wind_chill": "wind_chill",
+    "wet_bulb": "wet_bulb_temperature",
+    "absolute_humidity": "absolute_humidity",
+    "vapor_pressure_deficit": "vapor_pressure_deficit",
+}
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Xweatherly weather entity."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([XweatherlyWeather(coordinator, entry)], True)
+    async_add_entities([XweatherlyWeather(coordinator, entry)])
 
-class XweatherlyWeather(CoordinatorEntity,WeatherEntity):
+class XweatherlyWeather(XweatherlyEntity, WeatherEntity):
     """Xweatherly main weather entity."""
 
     _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
+    _sources = ("conditions",)
+    _fields = {
+        "conditions": tuple(key for keys in CONDITION_FIELDS.values() for key in keys),
+        "forecast_hourly": HOURLY_FORECAST_FIELDS,
+        "forecast_daily": DAILY_FORECAST_FIELDS,
+    }
 
     def __init__(self, coordinator, entry):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entry = entry
-        self._hass = coordinator.hass
         self._attr_name = entry.data.get("name", DEFAULT_NAME)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}"
+        # Forecast type -> ((generation, is_metric), forecast list)
+        self._forecast_cache = {}
 
     @property
     def device_info(self):
@@ -41,168 +78,195 @@ class XweatherlyWeather(CoordinatorEntity,WeatherEntity):
     @property
     def available(self):
         """Return if the entity is available."""
-        return "conditions" in self.coordinator.data and bool(self.coordinator.data["conditions"])
-
-    def _sel(self, metric, imperial):
-        """Select metric or imperial value based on Hass configuration."""
-        unit = self._hass.config.units.temperature_unit
-        is_metric = unit == UnitOfTemperature.CELSIUS
-        return metric if is_metric else imperial
+        return self.coordinator.snapshot is not None
 
     @property
     def native_temperature(self):
         """Return the temperature in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("tempC"), p.get("tempF"))
+        return self.coordinator.snapshot.temperature
 
     @property
     def native_temperature_unit(self):
         """Return the native temperature unit."""
-        return self._sel(UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT)
+        return self.coordinator.snapshot.temperature_unit
 
     @property
     def native_pressure(self):
         """Return the pressure in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("pressureMB"), p.get("pressureIN"))
+        return self.coordinator.snapshot.pressure
 
     @property
     def native_pressure_unit(self):
         """Return the native pressure unit."""
-        return self._sel(UnitOfPressure.HPA, UnitOfPressure.INHG)
+        return self.coordinator.snapshot.pressure_unit
 
     @property
     def native_wind_speed(self):
         """Return the wind speed in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("windSpeedMPS"), p.get("windSpeedMPH"))
+        return self.coordinator.snapshot.wind_speed
 
     @property
     def native_wind_speed_unit(self):
         """Return the native wind speed unit."""
-        return self._sel(UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR)
+        return self.coordinator.snapshot.speed_unit
 
     @property
     def wind_bearing(self):
         """Return the wind bearing."""
-        return self.coordinator.data["conditions"]["periods"][0].get("windDirDEG")
+        return self.coordinator.snapshot.wind_bearing
 
     @property
     def native_wind_gust_speed(self):
         """Return the wind gust speed in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("windGustMPS"), p.get("windGustMPH"))
+        return self.coordinator.snapshot.wind_gust_speed
 
     @property
     def native_wind_gust_speed_unit(self):
         """Return the native wind gust speed unit."""
-        return self._sel(UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR)
+        return self.coordinator.snapshot.speed_unit
 
     @property
     def humidity(self):
         """Return the humidity."""
-        return self.coordinator.data["conditions"]["periods"][0].get("humidity")
+        return self.coordinator.snapshot.humidity
 
     @property
     def native_dew_point(self):
         """Return the dew point in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("dewpointC"), p.get("dewpointF"))
+        return self.coordinator.snapshot.dew_point
 
     @property
     def native_dew_point_unit(self):
         """Return the native dew point unit."""
-        return self._sel(UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT)
+        return self.coordinator.snapshot.temperature_unit
 
     @property
     def native_visibility(self):
         """Return the visibility in native units."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        return self._sel(p.get("visibilityKM"), p.get("visibilityMI"))
+        return self.coordinator.snapshot.visibility
 
     @property
     def native_visibility_unit(self):
         """Return the native visibility unit."""
-        return self._sel("km", "mi")
+        return self.coordinator.snapshot.visibility_unit
 
     @property
     def condition(self):
         """Return the current weather condition."""
-        p = self.coordinator.data["conditions"]["periods"][0]
-        code = p.get("weatherPrimaryCoded", "::CL").split(":")[-1]
-        is_day = p.get("isDay", True)
-    
-        if code == "SC" and not is_day:
-            return ICON_MAP.get("SC-N", "cloudy")
-        
-        if code == "CL" and not is_day:
-            return ICON_MAP.get("CL-N", "cloudy")
-    
-        return ICON_MAP.get(code, "cloudy")
-
-    def _get_forecast_value(self, p, key_c, key_f):
-        """Get the correct forecast value based on user's units."""
-        unit = self._hass.config.units.temperature_unit
-        is_metric = unit == UnitOfTemperature.CELSIUS
-        return p.get(key_c) if is_metric else p.get(key_f)
+        return self.coordinator.snapshot.condition
+
+    def _get_forecast_values(self, columns, key_c, key_f):
+        """Get a forecast field for every period based on user's units."""
+        return columns.values(key_c if self.coordinator.is_metric else key_f)
+
+    def _forecast(self, forecast_type: str) -> list[Forecast]:
+        """Return a forecast list, rebuilding it only when its inputs change.
+
+        Lists are cached per coordinator generation of their data key and unit
+        system, so repeated reads from cards and services cost nothing.
+        """
+        source = FORECAST_SOURCES[forecast_type]
+        cache_key = (self.coordinator.generation[source], self.coordinator.is_metric)
+        cached = self._forecast_cache.get(forecast_type)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        columns = self.coordinator.data[source]
+        if forecast_type == "hourly":
+            forecast = self._build_hourly_forecast(columns)
+        else:
+            forecast = self._build_daily_forecast(columns)
+        self._add_derived(columns, forecast)
+        self._forecast_cache[forecast_type] = (cache_key, forecast)
+        return forecast
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update state and notify forecast subscribers of changed forecasts."""
+        super()._handle_coordinator_update()
+
+        changed = []
+        for forecast_type, source in FORECAST_SOURCES.items():
+            cached = self._forecast_cache.get(forecast_type)
+            # Nothing has read this forecast yet, so nobody is subscribed to it
+            if cached is None or source not in self.coordinator.changed_sources:
+                continue
+            if self._forecast(forecast_type) != cached[1]:
+                changed.append(forecast_type)
+        if changed:
+            self.hass.async_create_task(self.async_update_listeners(changed))
 
     async def async_forecast_hourly(self) -> list[Forecast]:
         """Return the hourly forecast."""
-        fc = []
-        for p in self.coordinator.data["forecast_hourly"]["periods"]:
-            code = p.get("weatherPrimaryCoded", "::CL").split(":")[-1]
-            is_day = p.get("isDay", True)
-            
-            if code == "SC" and not is_day:
-                condition_key = "SC-N"
-            elif code == "CL" and not is_day:
-                condition_key = "CL-N"
-            else:
-                condition_key = code
-            
-            fc.append(
-                Forecast(
-                    datetime=p["dateTimeISO"],
-                    temperature=self._get_forecast_value(p, "tempC", "tempF"),
-                    precipitation=self._get_forecast_value(p, "precipMM", "precipIN"),
-                    condition=ICON_MAP.get(condition_key, "cloudy"),
-                    humidity=p.get("humidity"),
-                    pressure=self._get_forecast_value(p, "pressureMB", "pressureIN"),
-                    wind_speed=self._get_forecast_value(p, "windSpeedMPS", "windSpeedMPH"),
-                    wind_bearing=p.get("windDirDEG"),
-                    wind_gust_speed=self._get_forecast_value(p, "windGustMPS", "windGustMPH"),
-                    dew_point=self._get_forecast_value(p, "dewpointC", "dewpointF"),
-                    precipitation_probability=p.get("pop"),
-                )
-            )
-        return fc
+        return self._forecast("hourly")
 
     async def async_forecast_daily(self) -> list[Forecast]:
         """Return the daily forecast."""
-        fc = []
-        for p in self.coordinator.data["forecast_daily"]["periods"]:
-            code = p.get("weatherPrimaryCoded", "::CL").split(":")[-1]
-            is_day = p.get("isDay", True)
-            
-            if code == "SC" and not is_day:
-                condition_key = "SC-N"
-            elif code == "CL" and not is_day:
-                condition_key = "CL-N"
-            else:
-                condition_key = code
-
-            fc.append(
-                Forecast(
-                    datetime=p["dateTimeISO"],
-                    temperature=self._get_forecast_value(p, "maxTempC", "maxTempF") or self._get_forecast_value(p, "tempC", "tempF"),
-                    templow=self._get_forecast_value(p, "minTempC", "minTempF"),
-                    precipitation=self._get_forecast_value(p, "precipMM", "precipIN"),
-                    condition=ICON_MAP.get(condition_key, "cloudy"),
-                    precipitation_probability=p.get("pop"),
-                    wind_speed=self._get_forecast_value(p, "windSpeedMPS", "windSpeedMPH"),
-                    wind_bearing=p.get("windDirDEG"),
-                    humidity=p.get("humidity"),
-                    dew_point=self._get_forecast_value(p, "dewpointC", "dewpointF"),
-                )
+        return self._forecast("daily")
+
+    def _add_derived(self, columns, forecast: list[Forecast]) -> None:
+        """Add the derived metric columns to built forecast entries."""
+        index = 0 if self.coordinator.is_metric else 1
+        derived = {"native_apparent_temperature": DERIVED_FIELDS["apparent_temperature"][index]}
+        if self.coordinator.forecast_extras:
+            derived.update(
+                (key, DERIVED_FIELDS[name][index]) for name, key in FORECAST_EXTRA_KEYS.items()
+            )
+        for key, field in derived.items():
+            for entry, value in zip(forecast, columns.values(field)):
+                entry[key] = value
+
+    def _build_hourly_forecast(self, columns) -> list[Forecast]:
+        """Build the hourly forecast from the columnar forecast store."""
+        temperature = self._get_forecast_values(columns, "tempC", "tempF")
+        precipitation = self._get_forecast_values(columns, "precipMM", "precipIN")
+        humidity = columns.values("humidity")
+        pressure = self._get_forecast_values(columns, "pressureMB", "pressureIN")
+        wind_speed = self._get_forecast_values(columns, "windSpeedMPS", "windSpeedMPH")
+        wind_bearing = columns.values("windDirDEG")
+        wind_gust_speed = self._get_forecast_values(columns, "windGustMPS", "windGustMPH")
+        dew_point = self._get_forecast_values(columns, "dewpointC", "dewpointF")
+        pop = columns.values("pop")
+        return [
+            Forecast(
+                datetime=columns.datetime_iso(i),
+                temperature=temperature[i],
+                precipitation=precipitation[i],
+                condition=columns.condition(i),
+                humidity=humidity[i],
+                pressure=pressure[i],
+                wind_speed=wind_speed[i],
+                wind_bearing=wind_bearing[i],
+                wind_gust_speed=wind_gust_speed[i],
+                dew_point=dew_point[i],
+                precipitation_probability=pop[i],
+            )
+            for i in range(len(columns))
+        ]
+
+    def _build_daily_forecast(self, columns) -> list[Forecast]:
+        """Build the daily forecast from the columnar forecast store."""
+        high = self._get_forecast_values(columns, "maxTempC", "maxTempF")
+        temperature = self._get_forecast_values(columns, "tempC", "tempF")
+        low = self._get_forecast_values(columns, "minTempC", "minTempF")
+        precipitation = self._get_forecast_values(columns, "precipMM", "precipIN")
+        pop = columns.values("pop")
+        wind_speed = self._get_forecast_values(columns, "windSpeedMPS", "windSpeedMPH")
+        wind_bearing = columns.values("windDirDEG")
+        humidity = columns.values("humidity")
+        dew_point = self._get_forecast_values(columns, "dewpointC", "dewpointF")
+        return [
+            Forecast(
+                datetime=columns.datetime_iso(i),
+                temperature=high[i] or temperature[i],
+                templow=low[i],
+                precipitation=precipitation[i],
+                condition=columns.condition(i),
+                precipitation_probability=pop[i],
+                wind_speed=wind_speed[i],
+                wind_bearing=wind_bearing[i],
+                humidity=humidity[i],
+                dew_point=dew_point[i],
             )
-        return fc
+            for i in range(len(columns))
+        ]
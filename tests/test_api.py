@@ -0,0 +1,105 @@
+"""Tests for the shared Xweather API client."""
+import asyncio
+import json
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.xweatherly import api
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+REQUESTS = [("conditions", None), ("forecasts", {"filter": "day", "limit": 7})]
+
+
+@pytest.fixture(autouse=True)
+def _no_session(monkeypatch):
+    monkeypatch.setattr(api, "async_get_clientsession", lambda hass: None)
+
+
+def _client():
+    """Return a client bound to the running loop."""
+    hass = SimpleNamespace(loop=asyncio.get_running_loop())
+    return api.XweatherlyApiClient(hass, "key", "id", "secret", 35.77, -78.64)
+
+
+def _batch_body(*payloads):
+    return {
+        "success": True,
+        "response": {
+            "responses": [{"success": True, "response": [payload]} for payload in payloads]
+        },
+    }
+
+
+def test_malformed_batch_body_fails_every_started_request():
+    async def run():
+        client = _client()
+        # `response` should be an object holding `responses`
+        client._request = AsyncMock(return_value={"success": True, "response": ["oops"]})
+        results = await client.async_fetch_batch(REQUESTS)
+        assert all(isinstance(result, AttributeError) for result in results)
+        assert not client._inflight
+        assert client.stats["batch"].errors == 1
+
+        # Nothing is left in flight, so the next fetch is sent
+        client._request = AsyncMock(return_value=_batch_body({"a": 1}, {"b": 2}))
+        results = await asyncio.wait_for(client.async_fetch_batch(REQUESTS), 1)
+        assert results == [{"a": 1}, {"b": 2}]
+
+    asyncio.run(run())
+
+
+def test_batch_reports_parts_without_data():
+    async def run():
+        client = _client()
+        body = _batch_body({"a": 1})
+        body["response"]["responses"].append(
+            {"success": True, "error": {"description": "no data"}, "response": []}
+        )
+        client._request = AsyncMock(return_value=body)
+        conditions, daily = await client.async_fetch_batch(REQUESTS)
+        assert conditions == {"a": 1}
+        assert isinstance(daily, api.XweatherlyNoData)
+
+    asyncio.run(run())
+
+
+def test_cache_keeps_latest_response_per_endpoint_and_filter():
+    async def run():
+        client = _client()
+        client._request = AsyncMock(
+            side_effect=lambda endpoint, params: {"success": True, "response": [dict(params)]}
+        )
+        hour = timedelta(hours=1)
+        for start in range(0, 10 * 3600, 3600):
+            await client.async_fetch("forecasts", {"filter": "1hr", "from": start})
+        await client.async_fetch("forecasts", {"filter": "day"})
+        assert len(client._cache) == 2
+
+        latest = {"filter": "1hr", "from": 9 * 3600}
+        client._request.reset_mock()
+        assert await client.async_fetch("forecasts", latest, max_age=hour) == latest
+        client._request.assert_not_called()
+        # A replaced request is fetched again
+        await client.async_fetch("forecasts", {"filter": "1hr", "from": 0}, max_age=hour)
+        client._request.assert_called_once()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(("hours", "in_executor"), [(24, False), (240, True)])
+def test_long_forecast_is_decoded_in_executor(hours, in_executor):
+    forecast = json.loads((FIXTURES / "forecasts_1hr.json").read_text())
+    forecast["response"][0]["periods"] = forecast["response"][0]["periods"][:hours]
+    body = json.dumps(forecast).encode()
+
+    async def run():
+        client = _client()
+        client.hass.async_add_executor_job = AsyncMock(side_effect=lambda func, arg: func(arg))
+        assert await client._decode("forecasts:1hr", body) == forecast
+        assert client.stats["forecasts:1hr"].executor_decodes == in_executor
+
+    asyncio.run(run())
@@ -0,0 +1,99 @@
+"""Tests for the billed-call budget."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.xweatherly import budget
+from custom_components.xweatherly.const import (
+    BUDGET_MAX_SCALE,
+    BUDGET_MIN_SCALE,
+    BUDGET_PERIOD_DAILY,
+    BUDGET_PERIOD_MONTHLY,
+)
+
+NOON = datetime(2025, 7, 14, 12, 0, tzinfo=timezone.utc)
+INTERVALS = {"conditions": timedelta(minutes=10), "forecast_hourly": timedelta(minutes=30)}
+
+
+class _Store:
+    def __init__(self, *args) -> None:
+        self.saved = None
+
+    def async_delay_save(self, data_func, delay) -> None:
+        self.saved = data_func()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"value": NOON}
+    monkeypatch.setattr(budget, "Store", _Store)
+    monkeypatch.setattr(budget.dt_util, "now", lambda: now["value"])
+    return now
+
+
+def _budget(allowance=1000, period=BUDGET_PERIOD_DAILY) -> budget.XweatherlyBudget:
+    return budget.XweatherlyBudget(None, "entry", allowance, period)
+
+
+def test_rate_weights_requests_by_multiplier():
+    # Three billed calls per request: 3/10 + 3/30 per minute
+    assert budget.XweatherlyBudget.rate(INTERVALS) == pytest.approx(0.4)
+
+
+def test_rate_counts_sub_minute_intervals_as_one_minute():
+    assert budget.XweatherlyBudget.rate({"conditions": timedelta(seconds=10)}) == 3
+
+
+def test_usage_is_recorded_per_key_and_persisted(clock):
+    tracker = _budget()
+    tracker.record("conditions")
+    tracker.record("conditions")
+    tracker.record("forecast_hourly")
+    assert tracker.usage == {"conditions": 6, "forecast_hourly": 3}
+    assert tracker.used == 9
+    assert tracker._store.saved["usage"] == tracker.usage
+
+
+def test_projection_and_scale_spread_the_remaining_allowance(clock):
+    tracker = _budget()
+    tracker.usage = {"conditions": 100}
+    # 720 minutes left today at 0.4 calls a minute
+    assert tracker.projected(INTERVALS) == pytest.approx(100 + 288)
+    assert tracker.interval_scale(INTERVALS) == pytest.approx(288 / 900)
+
+
+def test_scale_is_clamped(clock):
+    assert _budget(allowance=100_000).interval_scale(INTERVALS) == BUDGET_MIN_SCALE
+    tight = _budget(allowance=10)
+    assert tight.interval_scale(INTERVALS) == BUDGET_MAX_SCALE
+    tight.usage = {"conditions": 12}
+    assert tight.interval_scale(INTERVALS) == BUDGET_MAX_SCALE
+
+
+def test_no_allowance_keeps_intervals(clock):
+    assert _budget(allowance=0).interval_scale(INTERVALS) == 1.0
+
+
+def test_usage_resets_with_a_new_period(clock):
+    tracker = _budget()
+    tracker.record("conditions")
+    clock["value"] = NOON + timedelta(days=1)
+    assert tracker.used == 0
+
+
+def test_monthly_period_spans_the_month(clock):
+    tracker = _budget(period=BUDGET_PERIOD_MONTHLY)
+    tracker.record("conditions")
+    clock["value"] = NOON + timedelta(days=10)
+    assert tracker.used == 3
+    assert tracker._period_end() == datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+
+def test_switching_period_rolls_over(clock):
+    tracker = _budget(period=BUDGET_PERIOD_MONTHLY)
+    tracker.record("conditions")
+    tracker.configure(500, BUDGET_PERIOD_MONTHLY)
+    assert (tracker.allowance, tracker.used) == (500, 3)
+    tracker.configure(500, BUDGET_PERIOD_DAILY)
+    assert tracker.period_start == datetime(2025, 7, 14, tzinfo=timezone.utc)
+    assert tracker.used == 0
@@ -0,0 +1,53 @@
+"""Tests for the derived comfort and moisture metrics."""
+import math
+
+import pytest
+
+from custom_components.xweatherly.derived import DERIVED_FIELDS, derive, derive_period
+
+
+def test_heat_index_matches_nws_table():
+    # 90 °F at 70 % relative humidity is 106 °F in the NWS table
+    period = derive_period({"tempC": 32.2, "humidity": 70, "windSpeedMPS": 0})
+    assert period["heatIndexF"] == pytest.approx(106, abs=1)
+
+
+def test_heat_index_is_the_air_temperature_when_mild():
+    assert derive_period({"tempC": 20.0, "humidity": 50, "windSpeedMPS": 0})["heatIndexC"] == 20.0
+
+
+def test_wind_chill_matches_environment_canada_table():
+    # -10 °C with a 20 km/h wind feels like -17.9 °C
+    period = derive_period({"tempC": -10.0, "humidity": 50, "windSpeedMPS": 20 / 3.6})
+    assert period["windChillC"] == pytest.approx(-17.9, abs=0.1)
+
+
+def test_wind_chill_is_the_air_temperature_when_warm_or_calm():
+    assert derive_period({"tempC": 15.0, "humidity": 50, "windSpeedMPS": 10})["windChillC"] == 15.0
+    assert derive_period({"tempC": -5.0, "humidity": 50, "windSpeedMPS": 1})["windChillC"] == -5.0
+
+
+def test_wet_bulb_and_moisture():
+    period = derive_period({"tempC": 20.0, "humidity": 50, "windSpeedMPS": 0})
+    # Stull (2011) gives 13.7 °C at 20 °C and 50 %
+    assert period["wetBulbC"] == pytest.approx(13.7, abs=0.1)
+    assert period["absHumidityGM3"] == pytest.approx(8.6, abs=0.1)
+    assert period["vpdKPA"] == pytest.approx(1.17, abs=0.01)
+
+
+def test_missing_inputs_give_unknown_metrics():
+    period = derive_period({"tempC": 20.0, "humidity": None, "windSpeedMPS": 3})
+    assert set(period.values()) == {None}
+    no_wind = derive_period({"tempC": 20.0, "humidity": 50})
+    assert no_wind["windChillC"] is None and no_wind["apparentTempC"] is None
+    assert no_wind["heatIndexC"] == 20.0
+
+
+def test_derive_returns_aligned_columns():
+    columns = derive([20.0, None, 30.0], [50, 50, math.nan], [1, 2, 3])
+    keys = {key for pair in DERIVED_FIELDS.values() for key in pair}
+    assert set(columns) == keys
+    assert all(len(column) == 3 for column in columns.values())
+    assert not math.isnan(columns["wetBulbC"][0])
+    assert math.isnan(columns["wetBulbC"][1]) and math.isnan(columns["wetBulbC"][2])
+    assert columns["heatIndexF"][0] == 68.0
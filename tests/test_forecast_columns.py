@@ -0,0 +1,91 @@
+"""Tests for the columnar forecast store."""
+import math
+
+from custom_components.xweatherly.forecast_columns import INT_MISSING, ForecastColumns
+
+PERIODS = [
+    {
+        "timestamp": 1_752_516_000,
+        "dateTimeISO": "2025-07-14T14:00:00-04:00",
+        "tempC": 28.5,
+        "humidity": 64,
+        "pop": 20,
+        "isDay": True,
+        "weatherPrimaryCoded": ":L:RW",
+        "weather": "Light showers",
+    },
+    {
+        "timestamp": 1_752_519_600,
+        "dateTimeISO": "2025-07-14T15:00:00-04:00",
+        "tempC": None,
+        "humidity": 60,
+        "pop": None,
+        "isDay": False,
+        "weatherPrimaryCoded": "::CL",
+        "weather": "Clear",
+    },
+]
+
+
+def test_numeric_fields_become_typed_columns():
+    columns = ForecastColumns.from_periods(PERIODS)
+    assert set(columns.columns) == {"tempC", "humidity", "pop"}
+    assert columns.columns["humidity"].typecode == "i"
+    assert columns.columns["tempC"].typecode == "d"
+    assert columns.columns["pop"][1] == INT_MISSING
+    assert math.isnan(columns.columns["tempC"][1])
+    assert columns.values("tempC") == [28.5, None]
+    assert columns.value("pop", 1) is None
+    assert columns.value("pop", 5) is None
+    assert columns.values("dewpointC") == [None, None]
+
+
+def test_conditions_and_codes_are_interned():
+    columns = ForecastColumns.from_periods(PERIODS)
+    assert [columns.condition(0), columns.condition(1)] == ["rainy", "clear-night"]
+    assert [columns.code(0), columns.code(1)] == ["RW", "CL"]
+
+
+def test_uncoded_period_has_unknown_condition():
+    columns = ForecastColumns.from_periods([{"timestamp": 0, "weatherPrimaryCoded": None}])
+    assert columns.condition(0) is None
+    assert columns.code(0) is None
+
+
+def test_fields_limit_the_columns_kept():
+    columns = ForecastColumns.from_periods(PERIODS, fields={"timestamp", "humidity"})
+    assert set(columns.columns) == {"humidity"}
+
+
+def test_large_integers_use_a_double_column():
+    columns = ForecastColumns.from_periods([{"timestamp": 0, "big": 2**40}])
+    assert columns.columns["big"].typecode == "d"
+    assert columns.value("big", 0) == 2**40
+
+
+def test_periods_round_trip_with_timezone():
+    columns = ForecastColumns.from_periods(PERIODS)
+    assert columns.datetime_iso(0) == "2025-07-14T14:00:00-04:00"
+    restored = ForecastColumns.from_payload(columns.as_dict())
+    assert restored == columns
+    assert restored.datetime_iso(1) == "2025-07-14T15:00:00-04:00"
+    assert restored.condition(1) == "clear-night"
+    assert restored.code(0) == "RW"
+
+
+def test_equality_compares_values_including_gaps():
+    first = ForecastColumns.from_periods(PERIODS)
+    assert first == ForecastColumns.from_periods(PERIODS)
+    changed = [dict(PERIODS[0], tempC=29.0), PERIODS[1]]
+    assert first != ForecastColumns.from_periods(changed)
+
+
+def test_derived_columns_need_temperature_and_humidity():
+    columns = ForecastColumns.from_periods(PERIODS)
+    columns.add_derived()
+    assert "heatIndexC" in columns.columns
+    assert columns.value("heatIndexC", 1) is None
+
+    without_humidity = ForecastColumns.from_periods(PERIODS, fields={"tempC"})
+    without_humidity.add_derived()
+    assert set(without_humidity.columns) == {"tempC"}
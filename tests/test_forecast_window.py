@@ -0,0 +1,106 @@
+"""Tests for the incrementally revised hourly forecast window."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.xweatherly.const import FORECAST_REVISE_HOURS
+from custom_components.xweatherly.forecast_columns import ForecastColumns
+from custom_components.xweatherly.forecast_window import HOUR, HourlyForecastWindow
+
+NOW = datetime(2025, 7, 14, 12, 30, tzinfo=timezone.utc)
+START = int(NOW.timestamp()) - int(NOW.timestamp()) % HOUR
+PARAMS = {"filter": "1hr", "limit": 24}
+
+
+def _periods(start: int, hours: int, temp: float = 20.0) -> list[dict]:
+    return [
+        {"timestamp": start + hour * HOUR, "tempC": temp, "weatherPrimaryCoded": "::CL"}
+        for hour in range(hours)
+    ]
+
+
+def _loaded(hours: int) -> tuple[HourlyForecastWindow, ForecastColumns]:
+    """Return a window after a full fetch of its horizon at NOW."""
+    forecast = HourlyForecastWindow(hours, PARAMS)
+    request = forecast.plan(None, NOW)
+    payload = forecast.merge(None, request, {"periods": _periods(START, hours)}, NOW)
+    return forecast, ForecastColumns.from_payload(payload)
+
+
+def test_first_plan_fetches_whole_horizon():
+    forecast = HourlyForecastWindow(240, PARAMS)
+    assert forecast.plan(None, NOW) == {"filter": "1hr", "limit": 240}
+
+
+def test_short_horizon_is_always_fetched_in_full():
+    forecast, window = _loaded(24)
+    assert forecast.plan(window, NOW + timedelta(minutes=30)) == {"filter": "1hr", "limit": 24}
+
+
+def test_long_horizon_revises_near_term_hours_in_one_request():
+    forecast, window = _loaded(240)
+    later = NOW + timedelta(hours=1)
+    assert forecast.plan(window, later) == {
+        "filter": "1hr",
+        "limit": FORECAST_REVISE_HOURS,
+        "from": START + HOUR,
+    }
+
+
+def test_long_horizon_is_refetched_in_full_periodically():
+    forecast, window = _loaded(240)
+    assert "from" not in forecast.plan(window, NOW + timedelta(hours=6))
+
+
+def test_forced_plan_is_full():
+    forecast, window = _loaded(240)
+    assert "from" not in forecast.plan(window, NOW, full=True)
+
+
+def test_gap_at_window_start_needs_full_fetch():
+    forecast, _ = _loaded(240)
+    window = ForecastColumns.from_periods(_periods(START + 2 * HOUR, 200))
+    assert "from" not in forecast.plan(window, NOW)
+
+
+def test_window_shorter_than_revised_hours_needs_full_fetch():
+    forecast, _ = _loaded(240)
+    window = ForecastColumns.from_periods(_periods(START, FORECAST_REVISE_HOURS - 1))
+    assert "from" not in forecast.plan(window, NOW)
+
+
+def test_merge_replaces_revised_periods_and_drops_past_ones():
+    forecast, window = _loaded(240)
+    later = NOW + timedelta(hours=2)
+    request = forecast.plan(window, later)
+    revised = _periods(START + 2 * HOUR, FORECAST_REVISE_HOURS, temp=25.0)
+    merged = forecast.merge(window, request, {"periods": revised}, later)
+
+    timestamps = [period["timestamp"] for period in merged["periods"]]
+    assert timestamps[0] == START + 2 * HOUR
+    # The far end lags until the next full fetch
+    assert timestamps[-1] == START + 239 * HOUR
+    temps = [period["tempC"] for period in merged["periods"]]
+    assert temps[:FORECAST_REVISE_HOURS] == [25.0] * FORECAST_REVISE_HOURS
+    assert set(temps[FORECAST_REVISE_HOURS:]) == {20.0}
+
+
+def test_full_merge_replaces_window():
+    forecast, window = _loaded(240)
+    payload = {"periods": _periods(START, 240, temp=30.0)}
+    assert forecast.merge(window, forecast.params, payload, NOW) is payload
+
+
+def test_shrunk_horizon_is_trimmed_without_full_fetch():
+    forecast, window = _loaded(240)
+    forecast.resize(48)
+    request = forecast.plan(window, NOW)
+    assert request["limit"] == FORECAST_REVISE_HOURS
+    merged = forecast.merge(
+        window, request, {"periods": _periods(START, FORECAST_REVISE_HOURS)}, NOW
+    )
+    assert len(merged["periods"]) == 48
+
+
+def test_grown_horizon_is_fetched_in_full():
+    forecast, window = _loaded(48)
+    forecast.resize(240)
+    assert forecast.plan(window, NOW) == {"filter": "1hr", "limit": 240}
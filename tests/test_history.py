@@ -0,0 +1,88 @@
+"""Tests for the conditions history ring buffer and its trends."""
+import random
+
+import pytest
+
+from custom_components.xweatherly.history import MAX_WINDOW_OVERRUN, ConditionsHistory
+
+HOUR = 3600
+STEP = 300
+
+
+def _history(size=288) -> ConditionsHistory:
+    return ConditionsHistory(size=size, fields=("pressureMB",), windows=(1, 3))
+
+
+def _naive(observations, size, hours):
+    """Return (change, maximum) over the held observations, computed directly."""
+    held = observations[-size:]
+    latest_ts, latest = held[-1]
+    window = hours * HOUR
+    in_window = [value for ts, value in held if ts > latest_ts - window and value is not None]
+    maximum = max(in_window) if in_window else None
+    older = [(ts, value) for ts, value in held if ts <= latest_ts - window]
+    change = None
+    if older and latest_ts - older[-1][0] <= window * MAX_WINDOW_OVERRUN:
+        base = older[-1][1]
+        if base is not None and latest is not None:
+            change = latest - base
+    return change, maximum
+
+
+def test_change_rate_and_maximum():
+    history = _history()
+    for step in range(13):
+        history.add({"timestamp": step * STEP, "pressureMB": 1000 + step})
+    assert history.change("pressureMB", 1) == 12
+    assert history.rate("pressureMB", 1) == 12
+    assert history.maximum("pressureMB", 1) == 1012
+    # Not three hours of observations yet
+    assert history.change("pressureMB", 3) is None
+
+
+def test_older_or_repeated_observations_are_ignored():
+    history = _history()
+    assert history.add({"timestamp": 1000, "pressureMB": 1000})
+    assert not history.add({"timestamp": 1000, "pressureMB": 990})
+    assert not history.add({"timestamp": 900, "pressureMB": 990})
+    assert not history.add({"pressureMB": 990})
+    assert history.count == 1
+
+
+def test_change_is_unknown_after_a_long_gap():
+    history = _history()
+    history.add({"timestamp": 0, "pressureMB": 1000})
+    history.add({"timestamp": 2 * HOUR, "pressureMB": 1010})
+    assert history.change("pressureMB", 1) is None
+
+
+@pytest.mark.parametrize("size", [4, 7, 288])
+def test_trends_match_a_direct_computation_across_wraparound(size):
+    rng = random.Random(size)
+    history = _history(size)
+    observations = []
+    ts = 0
+    for _ in range(500):
+        ts += rng.choice((STEP, STEP, 2 * STEP, 20 * STEP))
+        value = None if rng.random() < 0.1 else round(rng.uniform(990, 1030), 1)
+        history.add({"timestamp": ts, "pressureMB": value})
+        observations.append((ts, value))
+        for hours in (1, 3):
+            change, maximum = _naive(observations, size, hours)
+            got = history.change("pressureMB", hours)
+            assert (got is None and change is None) or got == pytest.approx(change)
+            assert history.maximum("pressureMB", hours) == maximum
+
+
+def test_as_dict_holds_the_newest_observations_and_loads_back():
+    history = _history(size=4)
+    for step in range(10):
+        history.add({"timestamp": step * STEP, "pressureMB": None if step == 8 else step})
+    stored = history.as_dict()
+    assert stored["timestamps"] == [6 * STEP, 7 * STEP, 8 * STEP, 9 * STEP]
+    assert stored["fields"]["pressureMB"] == [6, 7, None, 9]
+
+    restored = _history(size=4)
+    restored.load(stored)
+    assert restored.as_dict() == stored
+    assert restored.maximum("pressureMB", 1) == history.maximum("pressureMB", 1) == 9
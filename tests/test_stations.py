@@ -0,0 +1,135 @@
+"""Tests for the nearest-station observation source."""
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+from custom_components.xweatherly.const import (
+    STATION_LIST_MAX_AGE,
+    STATION_MAX_AGE,
+    STATION_REJECT_TIME,
+)
+from custom_components.xweatherly.snapshot import condition_from_period
+from custom_components.xweatherly.stations import Station, StationIndex, XweatherlyStations
+
+NOW = datetime(2025, 7, 14, 18, 0, tzinfo=timezone.utc)
+
+
+def _observation(**ob) -> dict:
+    return {
+        "id": "PWS_1",
+        "ob": {
+            "timestamp": int(NOW.timestamp()),
+            "tempC": 28.0,
+            "QCcode": 10,
+            "isDay": True,
+            "weatherPrimaryCoded": None,
+            **ob,
+        },
+    }
+
+
+def _condition(conditions) -> str | None:
+    return condition_from_period(conditions["periods"][0])
+
+
+def test_uncoded_observation_takes_model_code():
+    conditions = XweatherlyStations.to_conditions(_observation(), NOW, "R")
+    assert _condition(conditions) == "rainy"
+
+
+def test_uncoded_observation_without_model_code_is_unknown():
+    conditions = XweatherlyStations.to_conditions(_observation(), NOW)
+    assert _condition(conditions) is None
+
+
+def test_coded_observation_keeps_its_code():
+    observation = _observation(weatherPrimaryCoded="::OV")
+    assert _condition(XweatherlyStations.to_conditions(observation, NOW, "R")) == "cloudy"
+
+
+def test_stale_or_failed_observation_is_rejected():
+    stale = NOW - timedelta(minutes=STATION_MAX_AGE + 1)
+    assert XweatherlyStations.to_conditions(_observation(timestamp=int(stale.timestamp())), NOW) is None
+    assert XweatherlyStations.to_conditions(_observation(QCcode=1), NOW) is None
+    assert XweatherlyStations.to_conditions(_observation(tempC=None), NOW) is None
+
+
+def test_wind_speeds_are_filled_from_kph():
+    conditions = XweatherlyStations.to_conditions(
+        _observation(windSpeedKPH=36, windGustKPH=54), NOW
+    )
+    period = conditions["periods"][0]
+    assert (period["windSpeedMPS"], period["windGustMPS"]) == (10.0, 15.0)
+
+
+def _station_list(*coords, qc=10) -> list[dict]:
+    return [
+        {
+            "id": f"PWS_{index}",
+            "loc": {"lat": lat, "long": lon},
+            "ob": {"tempC": 20.0, "QCcode": qc},
+        }
+        for index, (lat, lon) in enumerate(coords)
+    ]
+
+
+def test_index_finds_the_same_station_as_a_linear_scan():
+    rng = random.Random(7)
+    origin = (60.0, 10.0)
+    stations = [
+        Station(f"S{index}", origin[0] + rng.uniform(-0.3, 0.3), origin[1] + rng.uniform(-0.6, 0.6))
+        for index in range(200)
+    ]
+    index = StationIndex(stations, origin[0])
+    scale = math.cos(math.radians(origin[0]))
+
+    def projected(station, lat, lon):
+        return ((station.lon - lon) * scale) ** 2 + (station.lat - lat) ** 2
+
+    for _ in range(50):
+        lat, lon = origin[0] + rng.uniform(-0.3, 0.3), origin[1] + rng.uniform(-0.6, 0.6)
+        accept = (lambda station: int(station.id[1:]) % 3 != 0) if rng.random() < 0.5 else (
+            lambda station: True
+        )
+        expected = min(
+            (station for station in stations if accept(station)),
+            key=lambda station: projected(station, lat, lon),
+        )
+        assert index.nearest(lat, lon, accept) == expected
+
+
+def test_index_without_acceptable_stations():
+    assert StationIndex([], 0.0).nearest(0.0, 0.0) is None
+    index = StationIndex([Station("S", 1.0, 1.0)], 0.0)
+    assert index.nearest(0.0, 0.0, lambda station: False) is None
+
+
+def test_rejected_station_is_passed_over_until_its_time_is_up():
+    stations = XweatherlyStations(35.77, -78.64)
+    stations.load_list(_station_list((35.78, -78.64), (35.80, -78.64)), NOW)
+    assert stations.select(NOW) == "PWS_0"
+    assert stations.distance == 1.1
+
+    stations.reject(NOW)
+    assert stations.station_id is None
+    assert stations.select(NOW) == "PWS_1"
+    later = NOW + timedelta(minutes=STATION_REJECT_TIME)
+    assert stations.select(later) == "PWS_0"
+
+
+def test_station_list_skips_stations_failing_quality_checks():
+    stations = XweatherlyStations(35.77, -78.64)
+    stations.load_list(_station_list((35.78, -78.64), qc=1), NOW)
+    assert stations.select(NOW) is None
+    assert not stations.needs_list(NOW)
+    assert stations.needs_list(NOW + timedelta(minutes=STATION_LIST_MAX_AGE))
+
+
+def test_station_selection_survives_storage():
+    stations = XweatherlyStations(35.77, -78.64)
+    stations.load_list(_station_list((35.78, -78.64), (35.80, -78.64)), NOW)
+    stations.select(NOW)
+    restored = XweatherlyStations(35.77, -78.64)
+    restored.load(stations.as_dict())
+    assert restored.station_id == "PWS_0"
+    assert restored.stations == stations.stations
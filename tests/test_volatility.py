@@ -0,0 +1,80 @@
+"""Tests for the volatility score steering adaptive conditions polling."""
+from datetime import timedelta
+
+import pytest
+
+from custom_components.xweatherly.const import VOLATILITY_GUST, VOLATILITY_POP
+from custom_components.xweatherly.forecast_columns import ForecastColumns
+from custom_components.xweatherly.history import ConditionsHistory
+from custom_components.xweatherly.volatility import conditions_interval, volatility_signals
+
+NOW = 1_752_516_000
+HOUR = 3600
+
+
+def _hourly(*codes, pop=0) -> ForecastColumns:
+    return ForecastColumns.from_periods(
+        [
+            {"timestamp": NOW + index * HOUR, "pop": pop, "weatherPrimaryCoded": f"::{code}"}
+            for index, code in enumerate(codes)
+        ]
+    )
+
+
+def _conditions(code="CL", **fields) -> dict:
+    return {"periods": [{"weatherPrimaryCoded": f"::{code}", **fields}]}
+
+
+def test_calm_weather_scores_zero():
+    signals = volatility_signals(_conditions(), _hourly("CL", "CL"), ConditionsHistory(), NOW)
+    assert signals == {"precipitation": 0.0, "severe": 0.0}
+
+
+@pytest.mark.parametrize("code", ["T", "ZR"])
+def test_severe_codes_are_flagged(code):
+    current = volatility_signals(_conditions(code), _hourly("CL"), ConditionsHistory(), NOW)
+    upcoming = volatility_signals(_conditions(), _hourly("CL", code), ConditionsHistory(), NOW)
+    assert current["severe"] == upcoming["severe"] == 1.0
+
+
+@pytest.mark.parametrize("code", ["VA", "UP", "ZY", "ZL"])
+def test_codes_sharing_a_severe_condition_are_not_flagged(code):
+    signals = volatility_signals(_conditions(code), _hourly(code), ConditionsHistory(), NOW)
+    assert signals["severe"] == 0.0
+
+
+def test_uncoded_station_conditions_are_not_severe():
+    conditions = {"periods": [{"weatherPrimaryCoded": None}]}
+    assert volatility_signals(conditions, _hourly("CL"), ConditionsHistory(), NOW)["severe"] == 0.0
+
+
+def test_precipitation_and_gust_are_scaled_and_clamped():
+    signals = volatility_signals(
+        _conditions(windGustMPS=VOLATILITY_GUST / 2),
+        _hourly("R", pop=VOLATILITY_POP * 2),
+        ConditionsHistory(),
+        NOW,
+    )
+    assert signals["precipitation"] == 1.0
+    assert signals["gust"] == 0.5
+
+
+def test_forecast_beyond_lookahead_is_ignored():
+    hourly = _hourly("CL", "CL", "CL", "CL", "CL", "T")
+    assert volatility_signals(None, hourly, ConditionsHistory(), NOW)["severe"] == 0.0
+
+
+def test_missing_inputs_leave_signals_out():
+    assert volatility_signals(None, _hourly(), ConditionsHistory(), NOW) == {}
+
+
+@pytest.mark.parametrize(
+    ("score", "minutes"), [(0.0, 120), (0.5, 120 * (10 / 120) ** 0.5), (1.0, 10), (2.0, 10)]
+)
+def test_conditions_interval_is_geometric_between_bounds(score, minutes):
+    interval = conditions_interval(score, 10, 120)
+    assert interval.total_seconds() == pytest.approx(timedelta(minutes=minutes).total_seconds())
+
+
+def test_conditions_interval_accepts_swapped_bounds():
+    assert conditions_interval(1.0, 120, 10) == timedelta(minutes=10)